@@ -4,67 +4,106 @@ SeerrBridge - FastAPI entrypoint.
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import os
+import time
 from contextlib import asynccontextmanager
-from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from loguru import logger
+import orjson
+from pydantic import ValidationError
 import uvicorn
 
 from seerr import __version__
 from seerr.background_tasks import (
     ensure_setup,
     get_job_state,
+    queue_trigger,
+    request_resync,
     start_scheduler,
     stop_scheduler,
-    trigger_job_run,
 )
-from seerr.browser import driver, initialize_browser, shutdown_browser
+from seerr import browser as browser_module
+from seerr.browser import initialize_browser
 from seerr.config import load_config
+from seerr.http_client import close_client, open_client
 from seerr.models import WebhookPayload
+from seerr.overseerr import prewarm_overseerr
 from seerr.realdebrid import check_and_refresh_access_token
-from seerr.utils import START_TIME
+from seerr.utils import START_MONOTONIC
+
+
+# Uptime only changes once per second; reuse the last result within that second.
+_uptime_cache: tuple[int, dict] = (-1, {})
 
 
 def _format_uptime() -> dict:
-    uptime_seconds = int((datetime.now() - START_TIME).total_seconds())
+    global _uptime_cache
+    uptime_seconds = int(time.monotonic() - START_MONOTONIC)
+    if uptime_seconds == _uptime_cache[0]:
+        return _uptime_cache[1]
     days, remainder = divmod(uptime_seconds, 86400)
     hours, remainder = divmod(remainder, 3600)
     minutes, seconds = divmod(remainder, 60)
-    uptime_str = ""
-    if days:
-        uptime_str += f"{days}d "
-    if hours or days:
-        uptime_str += f"{hours}h "
-    if minutes or hours or days:
-        uptime_str += f"{minutes}m "
-    uptime_str += f"{seconds}s"
-    return {"uptime_seconds": uptime_seconds, "uptime": uptime_str.strip()}
+    parts = []
+    for value, unit in ((days, "d"), (hours, "h"), (minutes, "m"), (seconds, "s")):
+        # Leading zero units are dropped; seconds are always shown.
+        if value or parts or unit == "s":
+            parts.append(f"{value}{unit}")
+    result = {"uptime_seconds": uptime_seconds, "uptime": " ".join(parts)}
+    _uptime_cache = (uptime_seconds, result)
+    return result
+
+
+async def _startup():
+    """Refresh the RD token, start the scheduler, bring up the browser and queue the first run."""
+    # The token refresh is a blocking HTTP call; keep it off the event loop and
+    # warm the Overseerr connection while it runs. The scheduler only starts once
+    # both are done, so no job runs with a stale token or races the refresh thread.
+    await asyncio.gather(asyncio.to_thread(check_and_refresh_access_token), prewarm_overseerr())
+    await start_scheduler()
+    try:
+        await initialize_browser()
+        await ensure_setup()
+    except Exception as exc:
+        logger.error(f"Browser startup failed; the scheduler will retry: {exc}")
+    queue_trigger("startup")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Setup and teardown for the FastAPI app."""
+    # Python 3.12+: run new tasks synchronously until their first real suspension.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     logger.info(f"Booting SeerrBridge v{__version__}")
     if not load_config():
         logger.error("Configuration invalid; exiting.")
+        await logger.complete()
         os._exit(1)
 
-    check_and_refresh_access_token()
-    await initialize_browser()
-    await ensure_setup()
-    await start_scheduler()
-    await trigger_job_run("startup")
+    await open_client()
+    # Chrome takes a while to come up; serve /status and webhooks meanwhile.
+    startup_task = asyncio.create_task(_startup())
 
     try:
-        yield
+        # Sessions are started lazily by _startup; the pool quits them all on exit.
+        async with browser_module.pool:
+            try:
+                yield
+            finally:
+                startup_task.cancel()
+                await stop_scheduler()
     finally:
-        await stop_scheduler()
-        await shutdown_browser()
+        await close_client()
+        # Flush anything still queued for the enqueued log sinks.
+        await logger.complete()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 @app.get("/status")
@@ -75,31 +114,108 @@ async def status():
     return {
         "status": "running",
         "version": __version__,
-        "browser_initialized": driver is not None,
+        "browser_initialized": browser_module.browser_ready.is_set(),
         "job": job_state,
         **uptime_info,
     }
 
 
-@app.post("/jellyseer-webhook/")
+@app.post("/admin/resync", status_code=202)
+async def admin_resync():
+    """Force the size limits to be pushed to DMM again on a fresh job run."""
+    request_resync()
+    queue_trigger("resync")
+    return {"status": "accepted"}
+
+
+def _is_test_notification(item) -> bool:
+    return isinstance(item, dict) and item.get("notification_type") == "TEST_NOTIFICATION"
+
+
+async def _read_json(request: Request):
+    try:
+        return orjson.loads(await request.body())
+    except orjson.JSONDecodeError as exc:
+        logger.error(f"Invalid webhook payload: {exc}")
+        raise HTTPException(status_code=400, detail="Invalid payload") from exc
+
+
+def _accept_batch(items: list) -> dict:
+    """Validate a list of notifications and queue one job run for all of them."""
+    if not items:
+        logger.debug("Webhook batch received with no notifications.")
+        return {"status": "accepted", "count": 0}
+
+    notifications = [item for item in items if not _is_test_notification(item)]
+    try:
+        payloads = [WebhookPayload.model_validate(item) for item in notifications]
+    except ValidationError as exc:
+        logger.error(f"Invalid webhook batch: {exc}")
+        raise HTTPException(status_code=400, detail="Invalid payload") from exc
+
+    logger.info(
+        f"Webhook batch received: {len(payloads)} notification(s), "
+        f"{len(items) - len(payloads)} test notification(s)."
+    )
+    if not payloads:
+        return {"status": "success", "message": "Test notification processed."}
+
+    queue_trigger("webhook")
+    return {"status": "accepted", "count": len(payloads)}
+
+
+@app.post("/jellyseer-webhook/", status_code=202)
 async def jellyseer_webhook(request: Request):
     """Trigger the job whenever Overseerr/Jellyseerr fires a webhook."""
-    payload_data = await request.json()
+    payload_data = await _read_json(request)
+    if isinstance(payload_data, list):
+        return _accept_batch(payload_data)
+    # Test pings carry nothing we use, so skip model validation for them.
+    if _is_test_notification(payload_data):
+        logger.info("Webhook received: test notification.")
+        return {"status": "success", "message": "Test notification processed."}
 
     try:
-        payload = WebhookPayload(**payload_data)
-    except Exception as exc:
+        payload = WebhookPayload.model_validate(payload_data)
+    except ValidationError as exc:
         logger.error(f"Invalid webhook payload: {exc}")
         raise HTTPException(status_code=400, detail="Invalid payload") from exc
 
     logger.info(f"Webhook received: event={payload.event}, notification={payload.notification_type}")
 
-    if payload.notification_type == "TEST_NOTIFICATION":
-        return {"status": "success", "message": "Test notification processed."}
-
-    asyncio.create_task(trigger_job_run("webhook"))
+    # Acknowledge straight away; bursts of webhooks are batched into one run.
+    queue_trigger("webhook")
     return {"status": "accepted"}
 
 
+@app.post("/jellyseer-webhook-batch/", status_code=202)
+async def jellyseer_webhook_batch(request: Request):
+    """Accept several notifications in one call; they share a single job run."""
+    payload_data = await _read_json(request)
+    if not isinstance(payload_data, list):
+        payload_data = [payload_data]
+    return _accept_batch(payload_data)
+
+
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8777)
+    # Each worker process would run its own Chrome, scheduler and job loop, and every
+    # Chrome shares the same profile directory and debugging port, so only one worker
+    # is supported. Concurrency comes from BROWSER_POOL_SIZE instead.
+    requested_workers = os.getenv("WEB_CONCURRENCY") or os.getenv("WORKERS") or "1"
+    if requested_workers.strip() != "1":
+        logger.warning(
+            f"Ignoring WEB_CONCURRENCY/WORKERS={requested_workers!r}; SeerrBridge runs a single worker. "
+            "Use BROWSER_POOL_SIZE for parallel searches."
+        )
+
+    # uvloop has no Windows build, so fall back to the stock loop/parser when missing.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8777,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        # Health checks poll /status constantly; webhooks are logged by the handler.
+        access_log=False,
+        workers=1,
+    )
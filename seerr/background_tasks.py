@@ -4,43 +4,74 @@ Periodic job orchestration for SeerrBridge.
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
-from typing import List, Optional
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from seerr import browser as browser_module
-from seerr.config import JOB_INTERVAL_SECONDS, MAX_EPISODE_SIZE, MAX_MOVIE_SIZE
-from seerr.overseerr import get_overseerr_media_requests
-from seerr.search import MediaWorkItem, run_media_job
+from seerr import config
+from seerr.overseerr import get_overseerr_media_requests, log_pending_summary
+from seerr.search import MediaWorkItem, log_show_result, log_show_start, run_media_job, run_movie, run_show_season
 from seerr.trakt import get_media_details_from_trakt
 
-AVAILABLE_STATUS_CODES = {4, 5}  # Overseerr status codes for PARTIALLY_AVAILABLE / AVAILABLE
+AVAILABLE_STATUS_CODES = frozenset({4, 5})  # Overseerr status codes for PARTIALLY_AVAILABLE / AVAILABLE
+TRIGGER_BATCH_WINDOW_SECONDS = 0.5  # Webhooks arriving within this window share one run
+TRAKT_CACHE_TTL_SECONDS = 6 * 3600
+TRAKT_NEGATIVE_CACHE_TTL_SECONDS = 10 * 60  # Short, so upstream fixes show up quickly
+TRAKT_CACHE_MAX_ENTRIES = 4096
 
 _setup_complete = False
-_job_lock = asyncio.Lock()
+_setup_lock = asyncio.Lock()
 _scheduler_task: Optional[asyncio.Task] = None
+_worker_task: Optional[asyncio.Task] = None
+# Holds at most one pending trigger; anything queued behind it is coalesced.
+_trigger_queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+# (driver, movie size, episode size) last pushed to DMM; a new browser session re-applies.
+_last_applied: Tuple[object, Optional[str], Optional[str]] = (None, None, None)
+# (tmdb_id, media_type) -> (expires_at monotonic, Trakt details or None)
+_trakt_cache: Dict[Tuple[str, str], Tuple[float, Optional[dict]]] = {}
 
-_state = {
-    "job_running": False,
-    "last_trigger": None,
-    "last_run_started": None,
-    "last_run_completed": None,
-    "last_error": None,
-}
+
+@dataclass(slots=True)
+class JobState:
+    """Mutable job bookkeeping; /status reads the published snapshot instead."""
+
+    job_running: bool = False
+    last_trigger: Optional[str] = None
+    last_run_started: Optional[datetime] = None
+    last_run_completed: Optional[datetime] = None
+    last_run_duration_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+_state = JobState()
+_state_snapshot: dict = {}
 
 
 async def start_scheduler():
-    """Kick off the periodic job loop."""
-    global _scheduler_task
+    """Kick off the job worker and the periodic job loop."""
+    global _scheduler_task, _worker_task
+    if _worker_task is None:
+        _worker_task = asyncio.create_task(_worker())
     if _scheduler_task is None:
         _scheduler_task = asyncio.create_task(_job_loop())
-        logger.info(f"Background job scheduled every {JOB_INTERVAL_SECONDS} seconds.")
+        logger.info(f"Background job scheduled every {config.JOB_INTERVAL_SECONDS} seconds.")
 
 
 async def stop_scheduler():
-    """Stop the scheduler task if it is running."""
-    global _scheduler_task
+    """Stop the scheduler and job worker tasks if they are running."""
+    global _scheduler_task, _worker_task
+    if _worker_task:
+        _worker_task.cancel()
+        try:
+            await _worker_task
+        except asyncio.CancelledError:
+            pass
+        _worker_task = None
     if _scheduler_task:
         _scheduler_task.cancel()
         try:
@@ -51,46 +82,74 @@ async def stop_scheduler():
         logger.info("Background job scheduler stopped.")
 
 
+def queue_trigger(trigger_source: str):
+    """Ask the worker for a job run (used by the timer, webhook and startup).
+
+    If a run is already queued the trigger is folded into it, so a burst of
+    webhooks, or one arriving mid-run, costs at most one extra run.
+    """
+    try:
+        _trigger_queue.put_nowait(trigger_source)
+    except asyncio.QueueFull:
+        logger.debug(f"Job run already queued; {trigger_source} trigger coalesced.")
+
+
+def request_resync():
+    """Forget the applied size limits so the next job pushes them to DMM again."""
+    global _last_applied
+    _last_applied = (None, None, None)
+
+
 def get_job_state():
     """Expose scheduler status for the status endpoint."""
+    return _state_snapshot
+
+
+def _publish():
+    """Rebuild the /status snapshot; called on every job state transition."""
+    global _state_snapshot
+
     def _format(dt: Optional[datetime]):
         return dt.isoformat() if isinstance(dt, datetime) else None
 
-    return {
+    _state_snapshot = {
         "setup_complete": _setup_complete,
-        "job_running": _state["job_running"],
-        "job_interval_seconds": JOB_INTERVAL_SECONDS,
-        "last_trigger": _state["last_trigger"],
-        "last_run_started": _format(_state["last_run_started"]),
-        "last_run_completed": _format(_state["last_run_completed"]),
-        "last_error": _state["last_error"],
+        "job_running": _state.job_running,
+        "job_interval_seconds": config.JOB_INTERVAL_SECONDS,
+        "last_trigger": _state.last_trigger,
+        "last_run_started": _format(_state.last_run_started),
+        "last_run_completed": _format(_state.last_run_completed),
+        "last_run_duration_seconds": _state.last_run_duration_seconds,
+        "last_error": _state.last_error,
     }
 
 
+_publish()
+
+
 async def trigger_job_run(trigger_source: str):
-    """Run the job immediately (used by the timer and webhook)."""
+    """Run the job now. Only the worker calls this, so runs never overlap."""
     if not await ensure_setup():
         logger.warning(f"Setup incomplete; skipping job run triggered by {trigger_source}.")
         return False
 
-    if _job_lock.locked():
-        logger.info(f"Job already running; {trigger_source} trigger ignored.")
-        return False
-
-    async with _job_lock:
-        _state["job_running"] = True
-        _state["last_trigger"] = trigger_source
-        _state["last_run_started"] = datetime.utcnow()
-        _state["last_error"] = None
+    _state.job_running = True
+    _state.last_trigger = trigger_source
+    _state.last_run_started = datetime.now(timezone.utc)
+    _state.last_error = None
+    _publish()
+    started = time.monotonic()
 
-        try:
-            _run_once()
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.exception(f"Job execution failed: {exc}")
-            _state["last_error"] = str(exc)
-        finally:
-            _state["last_run_completed"] = datetime.utcnow()
-            _state["job_running"] = False
+    try:
+        await _run_once()
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.exception(f"Job execution failed: {exc}")
+        _state.last_error = str(exc)
+    finally:
+        _state.last_run_completed = datetime.now(timezone.utc)
+        _state.last_run_duration_seconds = round(time.monotonic() - started, 1)
+        _state.job_running = False
+        _publish()
 
     return True
 
@@ -99,119 +158,225 @@ async def ensure_setup() -> bool:
     """Ensure the browser is ready and the DMM settings are configured."""
     global _setup_complete
 
+    # Steady state: nothing to do once the browser is up and configured.
+    if _setup_complete and browser_module.driver is not None:
+        return True
+
     if browser_module.driver is None:
         await browser_module.initialize_browser()
 
-    if _setup_complete:
-        return True
+    # Setup drives the browser from a worker thread; keep concurrent callers out.
+    async with _setup_lock:
+        if _setup_complete:
+            return True
 
-    if not MAX_MOVIE_SIZE or not MAX_EPISODE_SIZE:
-        logger.error("MAX_MOVIE_SIZE and MAX_EPISODE_SIZE must be configured.")
-        return False
+        if not config.MAX_MOVIE_SIZE or not config.MAX_EPISODE_SIZE:
+            logger.error("MAX_MOVIE_SIZE and MAX_EPISODE_SIZE must be configured.")
+            return False
 
-    try:
-        browser_module.apply_size_limits(MAX_MOVIE_SIZE, MAX_EPISODE_SIZE)
-        _setup_complete = True
-        logger.success("Initial Debrid Media Manager setup complete.")
-    except Exception as exc:
-        logger.error(f"Failed to apply size limits: {exc}")
-        return False
+        try:
+            await _apply_size_limits()
+            _setup_complete = True
+            _publish()
+            logger.success("Initial Debrid Media Manager setup complete.")
+        except RuntimeError as exc:
+            logger.error(f"Failed to apply size limits: {exc}")
+            return False
 
     return True
 
 
-def _run_once():
-    """Fetch pending requests from Overseerr and dispatch the Selenium workflow."""
-    # Re-apply size limits at the start of every job to ensure settings
-    # stay in sync with the configured environment.
+async def _run_once():
+    """Fetch pending requests from Overseerr and dispatch the Selenium workflow.
+
+    Selenium work runs in a worker thread and API calls are async, so the event loop
+    keeps serving /status and webhooks while a job is in progress. The single
+    job worker guarantees only one thread drives the browser at a time.
+    """
+    # Re-apply size limits only when the configured values or the browser
+    # session changed since they were last pushed (or a resync was requested).
+    # Applying them also re-authenticates through login() on the settings page;
+    # otherwise the injected RD tokens keep the session signed in.
     try:
-        browser_module.apply_size_limits(MAX_MOVIE_SIZE, MAX_EPISODE_SIZE)
-        logger.debug("Re-applied Debrid Media Manager size limits at start of job.")
-    except Exception as exc:
+        if await _apply_size_limits():
+            logger.debug("Re-applied Debrid Media Manager size limits at start of job.")
+    except RuntimeError as exc:
         logger.error(f"Failed to re-apply size limits at job start: {exc}")
 
-    requests = get_overseerr_media_requests()
+    requests = await get_overseerr_media_requests()
     if not requests:
         logger.info("No pending Overseerr requests.")
         return
+    await log_pending_summary(requests)
 
-    work_items = _build_work_items(requests)
+    work_items = await _build_work_items(requests)
     if not work_items:
         logger.info("All requests are already satisfied or invalid.")
         return
 
-    movie_count = _count_movies(work_items)
-    show_count = _count_shows(work_items)
-    logger.info(f"Processing {movie_count} movie(s) and {show_count} show(s).")
-    run_media_job(work_items)
-
-
-def _build_work_items(requests: List[dict]) -> List[MediaWorkItem]:
-    items: List[MediaWorkItem] = []
-    for request in requests:
-        media = request.get("media") or {}
-        tmdb_id = media.get("tmdbId")
-        media_type = media.get("mediaType")
-        request_id = request.get("id")
-
-        if not tmdb_id or not media_type:
-            logger.debug(f"Skipping request without tmdbId or mediaType: {request}")
-            continue
-
-        details = get_media_details_from_trakt(str(tmdb_id), media_type)
-        if not details or not details.get("imdb_id"):
-            logger.warning(f"Unable to fetch details for TMDB ID {tmdb_id} ({media_type}).")
-            continue
-
-        title = details["title"]
-        if details.get("year"):
-            title = f"{title} ({details['year']})"
-
-        seasons = []
-        if media_type == "tv":
-            seasons = _pending_seasons(request)
-            if not seasons:
-                logger.info(f"Skipping show '{title}' - no pending seasons.")
-                continue
-
-        items.append(
-            MediaWorkItem(
-                request_id=request_id or 0,
-                tmdb_id=tmdb_id,
-                title=title,
-                imdb_id=details["imdb_id"],
-                media_type=media_type,
-                seasons=seasons,
-            )
+    counts = Counter(item.media_type for item in work_items)
+    logger.info(f"Processing {counts['movie']} movie(s) and {counts['tv']} show(s).")
+    if not len(browser_module.pool):
+        logger.error("Browser pool is empty; skipping job.")
+        return
+    if len(browser_module.pool) > 1:
+        await _run_on_pool(work_items)
+        return
+    await _on_pooled_driver(run_media_job, work_items)
+
+
+async def _run_on_pool(work_items: List[MediaWorkItem]):
+    """Spread the movies, then every pending season, across the pooled sessions."""
+    movies = [item for item in work_items if not item.is_show]
+    shows = [item for item in work_items if item.is_show and item.seasons]
+    # Movies still finish before any show starts.
+    await asyncio.gather(*(_on_pooled_driver(run_movie, movie) for movie in movies))
+
+    for show in shows:
+        log_show_start(show)
+    outcomes = await asyncio.gather(
+        *(_on_pooled_driver(run_show_season, show, season) for show in shows for season in show.seasons)
+    )
+    season_outcomes = iter(outcomes)
+    for show in shows:
+        log_show_result(show, sum(next(season_outcomes) for _ in show.seasons))
+
+
+async def _on_pooled_driver(func, *args):
+    """Run a blocking Selenium step in a worker thread on the next idle pooled session."""
+    pooled_driver = await browser_module.pool.acquire()
+    try:
+        return await asyncio.to_thread(func, *args, pooled_driver)
+    finally:
+        browser_module.pool.release(pooled_driver)
+
+
+async def _apply_size_limits() -> bool:
+    """Push the configured size limits to DMM unless this session already has them."""
+    global _last_applied
+    wanted = (browser_module.driver, config.MAX_MOVIE_SIZE, config.MAX_EPISODE_SIZE)
+    if wanted == _last_applied:
+        return False
+    await asyncio.to_thread(browser_module.apply_size_limits, config.MAX_MOVIE_SIZE, config.MAX_EPISODE_SIZE)
+    _last_applied = wanted
+    return True
+
+
+async def _build_work_items(requests: List[dict]) -> List[MediaWorkItem]:
+    valid = [request for request in requests if _has_media_ids(request)]
+
+    # Look every title up on Trakt concurrently, then assemble in request order.
+    all_details = await asyncio.gather(
+        *(
+            _cached_trakt_details(str(request["media"]["tmdbId"]), request["media"]["mediaType"])
+            for request in valid
         )
-    return items
+    )
 
+    candidates = [_to_work_item(request, details) for request, details in zip(valid, all_details)]
+    return [item for item in candidates if item is not None]
 
-def _pending_seasons(request: dict) -> List[int]:
-    pending = []
-    for season in request.get("seasons", []):
-        status = season.get("status")
-        number = season.get("seasonNumber")
-        if status in AVAILABLE_STATUS_CODES:
-            continue
-        if number is not None:
-            pending.append(int(number))
-    return pending
+
+def _has_media_ids(request: dict) -> bool:
+    media = request.get("media") or {}
+    if media.get("tmdbId") and media.get("mediaType"):
+        return True
+    logger.debug(f"Skipping request without tmdbId or mediaType: {request}")
+    return False
+
+
+def _to_work_item(request: dict, details: Optional[dict]) -> Optional[MediaWorkItem]:
+    media = request["media"]
+    tmdb_id = media["tmdbId"]
+    media_type = media["mediaType"]
+
+    if not details or not details.get("imdb_id"):
+        logger.warning(f"Unable to fetch details for TMDB ID {tmdb_id} ({media_type}).")
+        return None
+
+    title = details["title"]
+    if details.get("year"):
+        title = f"{title} ({details['year']})"
+
+    seasons = []
+    if media_type == "tv":
+        seasons = _pending_seasons(request)
+        if not seasons:
+            logger.info(f"Skipping show '{title}' - no pending seasons.")
+            return None
+
+    return MediaWorkItem(
+        request_id=request.get("id") or 0,
+        tmdb_id=tmdb_id,
+        title=title,
+        imdb_id=details["imdb_id"],
+        media_type=media_type,
+        seasons=seasons,
+    )
+
+
+async def _cached_trakt_details(tmdb_id: str, media_type: str) -> Optional[dict]:
+    """Trakt lookup with a TTL cache; requests stay pending across many job ticks."""
+    key = (tmdb_id, media_type)
+    now = time.monotonic()
+    cached = _trakt_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    details = await get_media_details_from_trakt(tmdb_id, media_type)
+    if details and details.get("imdb_id"):
+        ttl = TRAKT_CACHE_TTL_SECONDS
+    else:
+        ttl = TRAKT_NEGATIVE_CACHE_TTL_SECONDS
+
+    if len(_trakt_cache) >= TRAKT_CACHE_MAX_ENTRIES:
+        for stale_key in [k for k, (expires_at, _) in _trakt_cache.items() if expires_at <= now]:
+            del _trakt_cache[stale_key]
+        if len(_trakt_cache) >= TRAKT_CACHE_MAX_ENTRIES:
+            _trakt_cache.clear()
+    _trakt_cache[key] = (now + ttl, details)
+    return details
 
 
-def _count_movies(items: List[MediaWorkItem]) -> int:
-    return sum(1 for item in items if item.media_type == "movie")
+def _pending_seasons(request: dict) -> List[int]:
+    available = AVAILABLE_STATUS_CODES
+    return [
+        int(season["seasonNumber"])
+        for season in request.get("seasons", ())
+        if season.get("status") not in available and season.get("seasonNumber") is not None
+    ]
 
 
-def _count_shows(items: List[MediaWorkItem]) -> int:
-    return sum(1 for item in items if item.media_type == "tv")
+async def _worker():
+    """Single consumer of the trigger queue; turns each burst into one job run."""
+    try:
+        while True:
+            trigger_source = await _trigger_queue.get()
+            # Let the rest of a webhook burst land in this run rather than the next.
+            await asyncio.sleep(TRIGGER_BATCH_WINDOW_SECONDS)
+            while not _trigger_queue.empty():
+                trigger_source = _trigger_queue.get_nowait()
+            try:
+                await trigger_job_run(trigger_source)
+            except Exception as exc:
+                logger.error(f"Job run triggered by {trigger_source} failed: {exc}")
+    except asyncio.CancelledError:
+        logger.debug("Job worker cancelled.")
 
 
 async def _job_loop():
     """Background loop that triggers the job based on the configured interval."""
     try:
+        # Sleep towards fixed deadlines so the cadence doesn't drift; after a
+        # stall (e.g. a suspended host) restart the schedule from now.
+        next_tick = time.monotonic()
         while True:
-            await asyncio.sleep(JOB_INTERVAL_SECONDS)
-            await trigger_job_run("timer")
+            next_tick += config.JOB_INTERVAL_SECONDS
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_tick = time.monotonic()
+            queue_trigger("timer")
     except asyncio.CancelledError:
         logger.debug("Job loop cancelled.")
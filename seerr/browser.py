@@ -3,19 +3,29 @@ Browser automation utilities for SeerrBridge.
 """
 from __future__ import annotations
 
-import io
+import asyncio
+import base64
+import functools
+import heapq
+import json
 import os
+import weakref
 import platform
+import shutil
+import socket
+import tempfile
+import threading
 import time
 import zipfile
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.common.exceptions import (
-    ElementClickInterceptedException,
     NoSuchElementException,
     TimeoutException,
     WebDriverException,
@@ -25,170 +35,500 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select, WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
-
-from seerr.config import (
-    HEADLESS_MODE,
-    RD_ACCESS_TOKEN,
-    RD_CLIENT_ID,
-    RD_CLIENT_SECRET,
-    RD_REFRESH_TOKEN,
+from selenium.webdriver.support.ui import WebDriverWait
+
+from seerr import config
+
+_SYSTEM = platform.system().lower()
+_DRIVER_DIR = os.path.join(os.path.dirname(__file__), "chromedriver")
+_DRIVER_VERSION_FILE = os.path.join(_DRIVER_DIR, "version.txt")
+_DRIVER_VERSION_MAX_AGE = 24 * 3600  # Re-check the Stable channel at most once a day
+_RESULT_GRID_CSS = "div.grid-cols-1.gap-2.overflow-x-auto"
+# Starts recording DOM mutations on the page so a later wait can tell when results settle.
+_WATCH_RESULTS_JS = """
+const previous = window.__seerrbridgeWatch;
+if (previous) {
+    previous.observer.disconnect();
+}
+const watch = {changed: false, last: Date.now(), observer: null};
+watch.observer = new MutationObserver(() => {
+    watch.changed = true;
+    watch.last = Date.now();
+});
+watch.observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+window.__seerrbridgeWatch = watch;
+"""
+# Given quiet, idle and ceiling times in ms and the result grid selector, resolves true once
+# the page has been quiet for `quiet` ms after changing, or after `idle` ms with no change
+# while the grid is already shown. Resolves false at the ceiling, or straight away when the
+# search navigated to a new document (the watcher is gone, so nothing proves it settled).
+_WAIT_RESULTS_SETTLED_JS = """
+const [quietMs, idleMs, ceilingMs, gridCss, done] = arguments;
+const watch = window.__seerrbridgeWatch;
+const started = Date.now();
+const finish = (settled) => {
+    if (watch) {
+        watch.observer.disconnect();
+    }
+    window.__seerrbridgeWatch = null;
+    done(settled);
+};
+const poll = () => {
+    const now = Date.now();
+    if (!watch) {
+        finish(false);
+    } else if (watch.changed && now - watch.last >= quietMs) {
+        finish(true);
+    } else if (!watch.changed && now - started >= idleMs && document.querySelector(gridCss)) {
+        finish(true);
+    } else if (now - started >= ceilingMs) {
+        finish(false);
+    } else {
+        setTimeout(poll, 50);
+    }
+};
+poll();
+"""
+_CARD_CSS = "div.overflow-hidden.rounded-lg"
+_RESULT_CARD_CSS = f"{_RESULT_GRID_CSS} {_CARD_CSS}"
+# Maps every non-alphanumeric ASCII character to "-" for screenshot file names.
+_SAFE_NAME_TABLE = str.maketrans({ch: "-" for ch in map(chr, range(128)) if not ch.isalnum()})
+_BLOCKED_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*google-analytics*", "*googletagmanager*",
+)
+_LOGIN_BUTTON_XPATH = "//button[contains(text(), 'Login with Real Debrid')]"
+_SCRIPT_TIMEOUT_SECONDS = 60
+_WITH_EXTRAS_CHIP_XPATH = "//span[normalize-space()='With extras' or normalize-space()='With Extras']"
+# whole_season -> log label of the top banner Instant RD button
+_INSTANT_RD_LABELS = {True: "Instant RD (Whole Season)", False: "Instant RD"}
+# DMM keeps the client id/secret and refresh token as JSON strings; let the page encode them.
+# Only keys whose value differs are written; returns whether anything changed.
+_RD_TOKENS_JS = """
+const wanted = [
+    ['rd:accessToken', arguments[0]],
+    ['rd:clientId', JSON.stringify(arguments[1])],
+    ['rd:clientSecret', JSON.stringify(arguments[2])],
+    ['rd:refreshToken', JSON.stringify(arguments[3])],
+];
+let changed = false;
+for (const [key, value] of wanted) {
+    if (localStorage.getItem(key) !== value) {
+        localStorage.setItem(key, value);
+        changed = true;
+    }
+}
+return changed;
+"""
+# Sets both size selects in one round trip; returns the id of a select lacking the value.
+_SET_SIZE_LIMITS_JS = """
+const wanted = [['dmm-movie-max-size', arguments[0]], ['dmm-episode-max-size', arguments[1]]];
+for (const [id, value] of wanted) {
+    const select = document.getElementById(id);
+    if (!select || !Array.from(select.options).some(option => option.value === value)) {
+        return id;
+    }
+    select.value = value;
+    select.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return null;
+"""
+# Given the card selector, a click limit and the appear/settle timeouts in ms, clicks
+# 'Show More Results' until it disappears or the limit is hit; resolves the click count.
+_SHOW_MORE_LOOP_JS = """
+const [cardSelector, attempts, appearMs, settleMs, done] = arguments;
+const findButton = () => Array.from(document.querySelectorAll('button')).find(
+    (button) => button.textContent.includes('Show More Results')
+        && !button.disabled
+        && button.getClientRects().length > 0
+);
+const cardCount = () => document.querySelectorAll(cardSelector).length;
+const waitFor = (predicate, timeoutMs) => new Promise((resolve) => {
+    const deadline = Date.now() + timeoutMs;
+    const poll = () => {
+        const value = predicate();
+        if (value || Date.now() >= deadline) {
+            resolve(value);
+        } else {
+            setTimeout(poll, 100);
+        }
+    };
+    poll();
+});
+(async () => {
+    let clicks = 0;
+    while (clicks < attempts) {
+        const button = await waitFor(findButton, appearMs);
+        if (!button) {
+            break;
+        }
+        const before = cardCount();
+        button.click();
+        clicks += 1;
+        await waitFor(() => cardCount() > before, settleMs);
+    }
+    done(clicks);
+})();
+"""
+# Resolves with the number of result cards once it is non-zero and has held steady for
+# `stableMs`, or with whatever is there at the ceiling.
+_WAIT_CARDS_STABLE_JS = """
+const [cardSelector, stableMs, ceilingMs, done] = arguments;
+const started = Date.now();
+let lastCount = -1;
+let lastChange = started;
+const poll = () => {
+    const now = Date.now();
+    const count = document.querySelectorAll(cardSelector).length;
+    if (count !== lastCount) {
+        lastCount = count;
+        lastChange = now;
+    }
+    if ((count > 0 && now - lastChange >= stableMs) || now - started >= ceilingMs) {
+        done(count);
+    } else {
+        setTimeout(poll, 100);
+    }
+};
+poll();
+"""
+# Clicks arguments[0] and resolves true once its class attribute changes, false after arguments[1] ms.
+_CLICK_AND_WATCH_CLASS_JS = """
+const [element, timeoutMs, done] = arguments;
+const observer = new MutationObserver(() => {
+    observer.disconnect();
+    clearTimeout(timer);
+    done(true);
+});
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(false);
+}, timeoutMs);
+observer.observe(element, {attributes: true, attributeFilter: ['class']});
+element.click();
+"""
+# Given the grid and card selectors and a timeout in ms, polls in the page and resolves
+# true as soon as a valid (Complete/With extras, not Single) RD (100%) card shows up.
+_WAIT_RD_100_JS = """
+const [gridSelector, cardSelector, timeoutMs, done] = arguments;
+const normalize = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+const deadline = Date.now() + timeoutMs;
+const hasValidCard = () => {
+    const grid = document.querySelector(gridSelector);
+    if (!grid) {
+        return false;
+    }
+    for (const card of grid.querySelectorAll(cardSelector)) {
+        if (!normalize(card.textContent).includes('RD (100%)')) {
+            continue;
+        }
+        const statuses = Array.from(card.querySelectorAll('span'), (span) => normalize(span.innerText));
+        if (statuses.some((text) => text.startsWith('Single'))) {
+            continue;
+        }
+        if (statuses.some((text) => text.startsWith('Complete') || text.toLowerCase().startsWith('with extras'))) {
+            return true;
+        }
+    }
+    return false;
+};
+const poll = () => {
+    if (hasValidCard()) {
+        done(true);
+    } else if (Date.now() >= deadline) {
+        done(false);
+    } else {
+        setTimeout(poll, 100);
+    }
+};
+poll();
+"""
+# Given the grid and card selectors and whole_season, reports a valid RD (100%) card
+# ({found: true}) or else clicks the matching top-banner Instant RD button
+# ({clicked: true}); null while neither is on the page yet.
+_RD_100_OR_INSTANT_RD_JS = """
+const [gridSelector, cardSelector, wholeSeason] = arguments;
+const normalize = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+const grid = document.querySelector(gridSelector);
+if (grid) {
+    for (const card of grid.querySelectorAll(cardSelector)) {
+        if (!normalize(card.textContent).includes('RD (100%)')) {
+            continue;
+        }
+        const statuses = Array.from(card.querySelectorAll('span'), (span) => normalize(span.innerText));
+        if (statuses.some((text) => text.startsWith('Single'))) {
+            continue;
+        }
+        if (statuses.some((text) => text.startsWith('Complete') || text.toLowerCase().startsWith('with extras'))) {
+            return {found: true, clicked: false};
+        }
+    }
+}
+for (const button of document.querySelectorAll('button.mb-1')) {
+    const text = normalize(button.textContent);
+    if (!text.includes('Instant RD') || text.includes('Whole Season') !== wholeSeason) {
+        continue;
+    }
+    if (button.disabled || button.getClientRects().length === 0) {
+        continue;
+    }
+    button.click();
+    return {found: false, clicked: true};
+}
+return null;
+"""
+# Given the grid selector, clicks the first visible, enabled card-level Instant RD button. Returns 'clicked',
+# 'none' when the grid has no such button, or null while the grid has not rendered.
+_CLICK_CARD_INSTANT_RD_JS = """
+const grid = document.querySelector(arguments[0]);
+if (!grid) {
+    return null;
+}
+for (const button of grid.querySelectorAll('button')) {
+    const isInstantRd = Array.from(button.querySelectorAll('b')).some(
+        (label) => label.textContent.replace(/\\s+/g, ' ').trim() === 'Instant RD'
+    );
+    if (!isInstantRd || button.disabled || button.getClientRects().length === 0) {
+        continue;
+    }
+    button.scrollIntoView({block: 'center'});
+    button.click();
+    return 'clicked';
+}
+return 'none';
+"""
+_DEBUGGER_ADDRESS = "127.0.0.1:9222"  # Pooled tabs attach to the primary Chrome here
+# Lock files a Chrome that exited uncleanly leaves behind; they block reuse of the profile.
+_PROFILE_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+
+# The version lookup and the zip download share keep-alive connections; transient
+# failures are retried on the same pooled connections instead of failing the start-up.
+_download_session = requests.Session()
+_download_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=2,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+    ),
 )
 
 driver: Optional[webdriver.Chrome] = None
+# Set once a logged-in session exists; cleared again on shutdown.
+browser_ready = asyncio.Event()
+_init_lock = asyncio.Lock()
+_prune_lock = threading.Lock()
+# Set by save_debug_screenshot; the prune worker clears it and runs one pass, so a
+# burst of screenshots costs at most one extra pass.
+_prune_requested = threading.Event()
+_prune_thread: Optional[threading.Thread] = None
+_prune_thread_lock = threading.Lock()
+# chromedriver binary that last started Chrome in this process.
+_resolved_driver_path: Optional[str] = None
+# Driver -> (CDP identifier, credentials) of its registered Real-Debrid token script.
+_token_scripts: "weakref.WeakKeyDictionary[webdriver.Chrome, tuple]" = weakref.WeakKeyDictionary()
 
 
 def _prune_screenshots(screenshots_dir: str, *, max_keep: int) -> None:
+    """Delete the oldest PNGs so at most `max_keep` remain."""
     if max_keep <= 0:
         return
 
-    try:
-        entries = []
-        for name in os.listdir(screenshots_dir):
-            if not name.lower().endswith(".png"):
-                continue
-            path = os.path.join(screenshots_dir, name)
-            if not os.path.isfile(path):
-                continue
-            try:
-                entries.append((os.path.getmtime(path), path))
-            except OSError:
-                continue
-
-        # Keep space for the new screenshot we're about to write.
-        target_keep = max(max_keep - 1, 0)
-        if len(entries) <= target_keep:
+    # Pooled sessions can save screenshots from several threads at once.
+    with _prune_lock:
+        try:
+            entries = []
+            # scandir gets the file type from the directory listing, leaving one stat per PNG.
+            with os.scandir(screenshots_dir) as listing:
+                for entry in listing:
+                    if not entry.name.lower().endswith(".png"):
+                        continue
+                    try:
+                        if entry.is_file():
+                            entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+
+            if len(entries) <= max_keep:
+                return
+
+            # Only the oldest surplus entries are needed, so skip the full sort.
+            to_delete = heapq.nsmallest(len(entries) - max_keep, entries, key=lambda item: item[0])
+            for _, path in to_delete:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+        except OSError:
             return
 
-        entries.sort(key=lambda item: item[0])  # oldest first
-        to_delete = entries[: max(0, len(entries) - target_keep)]
-        for _, path in to_delete:
-            try:
-                os.remove(path)
-            except OSError:
-                continue
-    except OSError:
-        return
 
+def _prune_worker():
+    """Run a prune pass each time one is requested, for the life of the process."""
+    while True:
+        _prune_requested.wait()
+        _prune_requested.clear()
+        _prune_screenshots(config.SCREENSHOTS_DIR, max_keep=config.SCREENSHOTS_MAX_KEEP)
+
+
+def _schedule_prune():
+    """Ask the background worker to prune, starting it on first use."""
+    global _prune_thread
+    _prune_requested.set()
+    with _prune_thread_lock:
+        if _prune_thread is None:
+            _prune_thread = threading.Thread(target=_prune_worker, name="screenshot-prune", daemon=True)
+            _prune_thread.start()
 
-def save_debug_screenshot(name: str = "fullpage"):
+
+def save_debug_screenshot(name: str = "fullpage", active_driver=None):
     """
-    Try to capture (almost) the full page in one screenshot by resizing
-    the window height to match the document height.
+    Capture the full page in one screenshot via CDP, rendering beyond the
+    viewport instead of resizing the window.
+    Captures the primary session unless another driver is given.
 
     Returns: full path to the screenshot, or None on failure.
     """
-    if os.getenv("SCREENSHOTS_ENABLED", "true").lower() != "true":
+    if not config.SCREENSHOTS_ENABLED:
         return None
 
-    global driver
-    if driver is None:
+    active_driver = active_driver or driver
+    if active_driver is None:
         logger.warning("Cannot take full-page screenshot: driver is not initialized.")
         return None
 
     # Where to save
-    screenshots_dir = os.getenv("SCREENSHOTS_DIR") or os.path.join("logs", "screenshots")
+    screenshots_dir = config.SCREENSHOTS_DIR
     os.makedirs(screenshots_dir, exist_ok=True)
-    try:
-        max_keep = int(os.getenv("SCREENSHOTS_MAX_KEEP", "10"))
-    except ValueError:
-        max_keep = 10
-    _prune_screenshots(screenshots_dir, max_keep=max_keep)
 
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    safe_name = "".join(ch if ch.isalnum() else "-" for ch in name.strip().lower())[:80] or "screenshot"
+    safe_name = name.strip().lower().translate(_SAFE_NAME_TABLE)[:80] or "screenshot"
     filename = f"{safe_name}_{timestamp}.png"
     path = os.path.join(screenshots_dir, filename)
 
     try:
-        # Get page dimensions
-        total_height = driver.execute_script("""
-            return Math.max(
-                document.body.scrollHeight,
-                document.documentElement.scrollHeight,
-                document.body.offsetHeight,
-                document.documentElement.offsetHeight,
-                document.body.clientHeight,
-                document.documentElement.clientHeight
-            );
-        """)
-        viewport_width = driver.execute_script("return document.documentElement.clientWidth;")
-
-        # Resize the window to fit the full height
-        logger.info(f"Resizing window to {viewport_width}x{total_height} for full-page screenshot.")
-        driver.set_window_size(viewport_width, total_height)
-        time.sleep(1)  # let layout settle
-
-        driver.save_screenshot(path)
-        logger.info(f"Saved FULL-PAGE debug screenshot to {path}")
-        return path
+        screenshot = active_driver.execute_cdp_cmd(
+            "Page.captureScreenshot",
+            {"format": "png", "captureBeyondViewport": True, "fromSurface": True},
+        )
+        with open(path, "wb") as handle:
+            handle.write(base64.b64decode(screenshot["data"]))
+        logger.debug(f"Saved FULL-PAGE debug screenshot to {path}")
     except Exception as e:
         logger.error(f"Failed to save full-page screenshot: {e}")
         return None
 
+    # Requested after the write, so the pass keeps exactly the newest SCREENSHOTS_MAX_KEEP
+    # files; the directory scan runs on the prune worker, off the Selenium path.
+    _schedule_prune()
+    return path
+
+
+_CHROME_ARGS = (
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-setuid-sandbox",
+    "--window-size=1920,1080",
+    "--profile-directory=Default",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    # Pooled sessions are background tabs; keep their timers and rendering at full speed.
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--enable-logging",
+    "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+
 
 def _build_chrome_options() -> ChromeOptions:
     """Create a Chrome options instance configured for headless automation."""
     options = webdriver.ChromeOptions()
-    if HEADLESS_MODE:
+    if config.HEADLESS_MODE:
         options.add_argument("--headless=new")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-setuid-sandbox")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--disable-infobars")
-    options.add_argument("--enable-logging")
+    options.add_argument(f"--user-data-dir={config.CHROME_PROFILE_DIR}")
+    for argument in _CHROME_ARGS:
+        options.add_argument(argument)
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-    if (
-        platform.system().lower() == "linux"
-        and os.getenv("RUNNING_IN_DOCKER", "false").lower() == "true"
-    ):
-        # Prefer an explicit container-provided Chrome path if available.
-        chrome_bin = os.getenv("CHROME_BIN")
-        if chrome_bin and os.path.exists(chrome_bin):
-            options.binary_location = chrome_bin
-        else:
-            default_bin = "/usr/bin/google-chrome"
-            if os.path.exists(default_bin):
-                options.binary_location = default_bin
-            else:
-                logger.debug("RUNNING_IN_DOCKER set but no Chrome binary found at CHROME_BIN or /usr/bin/google-chrome.")
+    chrome_bin = _chrome_binary()
+    if chrome_bin:
+        options.binary_location = chrome_bin
     return options
 
 
+@functools.lru_cache(maxsize=None)
+def _chrome_binary() -> Optional[str]:
+    """Resolve the container-provided Chrome binary once; None lets Selenium pick."""
+    if _SYSTEM != "linux" or os.getenv("RUNNING_IN_DOCKER", "false").lower() != "true":
+        return None
+    # Prefer an explicit container-provided Chrome path if available.
+    for candidate in (os.getenv("CHROME_BIN"), "/usr/bin/google-chrome"):
+        if candidate and os.path.exists(candidate):
+            return candidate
+    logger.debug("RUNNING_IN_DOCKER set but no Chrome binary found at CHROME_BIN or /usr/bin/google-chrome.")
+    return None
+
+
+def _cached_driver_version(driver_path: str) -> Optional[str]:
+    """Return the recorded version of a previously downloaded driver, if it is still on disk."""
+    if not (os.path.exists(driver_path) and os.path.exists(_DRIVER_VERSION_FILE)):
+        return None
+    with open(_DRIVER_VERSION_FILE, encoding="utf-8") as handle:
+        return handle.read().strip() or None
+
+
+def _chrome_for_testing_platform() -> Optional[str]:
+    """Map this host to its Chrome for Testing platform id, or None if unsupported."""
+    arch = platform.machine().lower()
+    if _SYSTEM == "windows":
+        return "win32" if platform.architecture()[0] == "32bit" else "win64"
+    if _SYSTEM == "linux":
+        return "linux64" if arch in {"x86_64"} else "linux-arm64"
+    if _SYSTEM == "darwin":
+        return "mac-arm64" if arch in {"arm64", "aarch64"} else "mac-x64"
+    return None
+
+
+# The host never changes, so resolve it once instead of on every driver lookup.
+_PLATFORM_ID = _chrome_for_testing_platform()
+
+
 def _latest_chromedriver_path() -> Optional[str]:
     """
     Download the latest Chrome driver from Google's Chrome for Testing initiative.
+    A previous download is reused while it matches the Stable version.
     Returns the path if successful, otherwise None.
     """
     try:
-        system = platform.system().lower()
-        arch = platform.machine().lower()
-        platform_map = {
-            "windows": "win32" if platform.architecture()[0] == "32bit" else "win64",
-            "linux": "linux64" if arch in {"x86_64"} else "linux-arm64",
-            "darwin": "mac-arm64" if arch in {"arm64", "aarch64"} else "mac-x64",
-        }
-        platform_id = platform_map.get(system)
+        platform_id = _PLATFORM_ID
         if not platform_id:
             logger.warning("Unsupported OS for Chrome for Testing driver download.")
             return None
 
-        response = requests.get(
+        executable = "chromedriver.exe" if _SYSTEM == "windows" else "chromedriver"
+        driver_path = os.path.join(_DRIVER_DIR, f"chromedriver-{platform_id}", executable)
+        cached_version = _cached_driver_version(driver_path)
+        if cached_version and time.time() - os.path.getmtime(_DRIVER_VERSION_FILE) < _DRIVER_VERSION_MAX_AGE:
+            logger.debug(f"Using cached Chrome driver {cached_version}.")
+            return driver_path
+
+        response = _download_session.get(
             "https://googlechromelabs.github.io/chrome-for-testing/"
             "last-known-good-versions-with-downloads.json",
             timeout=10,
         )
         response.raise_for_status()
         data = response.json()
+        stable_version = data["channels"]["Stable"]["version"]
+        if cached_version == stable_version:
+            os.utime(_DRIVER_VERSION_FILE)  # Restart the max-age window
+            logger.debug(f"Cached Chrome driver {cached_version} is current.")
+            return driver_path
+
         downloads = data["channels"]["Stable"]["downloads"]["chromedriver"]
         download_url = next(
             (item["url"] for item in downloads if item["platform"] == platform_id),
@@ -198,20 +538,25 @@ def _latest_chromedriver_path() -> Optional[str]:
             logger.warning("Could not locate Chrome driver download URL.")
             return None
 
-        driver_dir = os.path.join(os.path.dirname(__file__), "chromedriver")
-        os.makedirs(driver_dir, exist_ok=True)
+        os.makedirs(_DRIVER_DIR, exist_ok=True)
 
-        logger.info(f"Downloading Chrome driver for {platform_id}")
-        driver_zip = requests.get(download_url, timeout=20)
-        driver_zip.raise_for_status()
+        logger.info(f"Downloading Chrome driver {stable_version} for {platform_id}")
+        # Stream the zip to a temporary file so it is never held in memory.
+        with tempfile.TemporaryFile() as buffer:
+            with _download_session.get(download_url, stream=True, timeout=20) as driver_zip:
+                driver_zip.raise_for_status()
+                driver_zip.raw.read = functools.partial(driver_zip.raw.read, decode_content=True)
+                shutil.copyfileobj(driver_zip.raw, buffer, length=1 << 20)
+            buffer.seek(0)
 
-        with zipfile.ZipFile(io.BytesIO(driver_zip.content)) as archive:
-            archive.extractall(driver_dir)
+            with zipfile.ZipFile(buffer) as archive:
+                # Only the executable is needed; skip the licence and notice files.
+                archive.extract(f"chromedriver-{platform_id}/{executable}", _DRIVER_DIR)
 
-        executable = "chromedriver.exe" if system == "windows" else "chromedriver"
-        driver_path = os.path.join(driver_dir, f"chromedriver-{platform_id}", executable)
-        if system != "windows":
+        if _SYSTEM != "windows":
             os.chmod(driver_path, 0o755)
+        with open(_DRIVER_VERSION_FILE, "w", encoding="utf-8") as handle:
+            handle.write(stable_version)
 
         return driver_path
     except Exception as exc:
@@ -219,80 +564,292 @@ def _latest_chromedriver_path() -> Optional[str]:
         return None
 
 
+class BrowserPool:
+    """
+    Bounded set of logged-in Chrome sessions.
+    Jobs lease a driver with acquire() and hand it back with release().
+    Used as an async context manager, leaving the block shuts every session down.
+    """
+
+    def __init__(self):
+        self._drivers: List[webdriver.Chrome] = []
+        self._idle: asyncio.Queue = asyncio.Queue()
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await shutdown_browser()
+
+    def __len__(self) -> int:
+        return len(self._drivers)
+
+    def add(self, pooled_driver: webdriver.Chrome):
+        self._drivers.append(pooled_driver)
+        self._idle.put_nowait(pooled_driver)
+
+    async def acquire(self) -> webdriver.Chrome:
+        return await self._idle.get()
+
+    def release(self, pooled_driver: webdriver.Chrome):
+        if pooled_driver in self._drivers:
+            self._idle.put_nowait(pooled_driver)
+
+    def clear(self) -> List[webdriver.Chrome]:
+        """Forget every driver and return them so the caller can quit them."""
+        drivers, self._drivers = self._drivers, []
+        # Drain in place: jobs already waiting in acquire() stay on this queue
+        # and pick up the sessions a re-initialized browser adds.
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        return drivers
+
+
+pool = BrowserPool()
+
+
 async def initialize_browser():
-    """Start the Selenium browser session if it is not already running."""
+    """
+    Start the Selenium browser session if it is not already running.
+    The primary session becomes `driver`; BROWSER_POOL_SIZE - 1 extra sessions
+    are opened as tabs of the same Chrome and every session is added to `pool`.
+    Tabs share the primary's localStorage, so login and size limits carry over.
+    Chrome start-up and page loads block, so they run in a worker thread.
+    """
     global driver
-    if driver:
+    async with _init_lock:
+        if driver:
+            return driver
+
+        try:
+            driver = await asyncio.to_thread(_launch_driver, config.BROWSER_POOL_SIZE > 1)
+        except WebDriverException as exc:
+            logger.error(f"Failed to initialize browser: {exc}")
+            raise
+        pool.add(driver)
+
+        for index in range(2, config.BROWSER_POOL_SIZE + 1):
+            try:
+                extra = await asyncio.to_thread(_attach_tab)
+            except WebDriverException as exc:
+                logger.warning(f"Could not open pooled tab {index}/{config.BROWSER_POOL_SIZE}: {exc}")
+                break
+            pool.add(extra)
+
+        browser_ready.set()
+        logger.success(f"Browser session initialized ({len(pool)} in pool).")
         return driver
 
+
+def _launch_driver(shared: bool = False) -> webdriver.Chrome:
+    """
+    Start one Chrome session and load DMM with the Real-Debrid tokens in place.
+    With shared=True the browser also listens on the debugging port for pooled tabs.
+    """
+    _remove_stale_profile_locks(config.CHROME_PROFILE_DIR)
     options = _build_chrome_options()
-    env_driver_path = os.getenv("CHROME_DRIVER_PATH")
+    if shared:
+        options.add_argument(f"--remote-debugging-port={_DEBUGGER_ADDRESS.rsplit(':', 1)[1]}")
+    new_driver = _start_chrome(options)
 
     try:
-        if env_driver_path and os.path.exists(env_driver_path):
-            service = Service(env_driver_path)
-            driver = webdriver.Chrome(service=service, options=options)
-        else:
-            try:
-                # Let Selenium Manager locate/download a matching driver for the installed browser.
-                driver = webdriver.Chrome(options=options)
-            except WebDriverException:
-                chromedriver_path = _latest_chromedriver_path()
-                if chromedriver_path and os.path.exists(chromedriver_path):
-                    service = Service(chromedriver_path)
-                    driver = webdriver.Chrome(service=service, options=options)
-                else:
-                    logger.info("Falling back to webdriver_manager for Chrome driver installation.")
-                    service = Service(ChromeDriverManager().install())
-                    driver = webdriver.Chrome(service=service, options=options)
-        driver.execute_cdp_cmd(
-            "Page.addScriptToEvaluateOnNewDocument",
-            {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"},
-        )
-        driver.get("https://debridmediamanager.com")
-        _inject_real_debrid_tokens()
-        login(driver)
-        logger.success("Browser session initialized.")
-        return driver
-    except WebDriverException as exc:
-        logger.error(f"Failed to initialize browser: {exc}")
-        driver = None
+        _configure_session(new_driver)
+        # Installed before the first load, so DMM boots already authenticated.
+        install_real_debrid_tokens(new_driver)
+        new_driver.get("https://debridmediamanager.com")
+    except WebDriverException:
+        new_driver.quit()
         raise
+    return new_driver
+
+
+def _remove_stale_profile_locks(profile_dir: str):
+    """
+    Delete the Singleton* files a crashed Chrome left in the profile directory.
+    Chrome points SingletonLock at "<hostname>-<pid>"; the files are only removed
+    when that process is gone or belongs to another host, so a live Chrome never
+    has its profile opened a second time.
+    """
+    lock_path = os.path.join(profile_dir, "SingletonLock")
+    try:
+        owner = os.readlink(lock_path)
+    except OSError:
+        # No lock (or not a symlink lock this code understands): nothing to clear.
+        return
+    host, _, pid = owner.rpartition("-")
+    if host == socket.gethostname() and _process_alive(pid):
+        logger.warning(f"Chrome profile {profile_dir} is locked by running process {pid}; leaving it alone.")
+        return
+
+    for name in _PROFILE_LOCK_FILES:
+        path = os.path.join(profile_dir, name)
+        # SingletonLock is a dangling symlink once its owner is gone, so test with lexists.
+        if not os.path.lexists(path):
+            continue
+        try:
+            os.remove(path)
+            logger.debug(f"Removed stale Chrome profile lock {path}")
+        except OSError as exc:
+            logger.warning(f"Could not remove stale Chrome profile lock {path}: {exc}")
+
+
+def _process_alive(pid: str) -> bool:
+    """True unless `pid` is not a number or no such process exists."""
+    try:
+        os.kill(int(pid), 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _attach_tab() -> webdriver.Chrome:
+    """Attach a second WebDriver session to the primary Chrome and give it its own tab."""
+    options = webdriver.ChromeOptions()
+    options.debugger_address = _DEBUGGER_ADDRESS
+    new_driver = _start_chrome(options)
+
+    try:
+        new_driver.switch_to.new_window("tab")
+        _configure_session(new_driver)
+        new_driver.get("https://debridmediamanager.com")
+    except WebDriverException:
+        _close_tab(new_driver)
+        raise
+    return new_driver
+
+
+def _close_tab(attached_driver: webdriver.Chrome):
+    """Close an attached session's tab and detach, leaving the shared browser running."""
+    try:
+        attached_driver.close()
+    except WebDriverException:
+        pass
+    attached_driver.quit()
+
+
+def _configure_session(active_driver: webdriver.Chrome):
+    """Per-tab setup shared by the primary session and pooled tabs."""
+    _hide_webdriver_flag(active_driver)
+    _block_heavy_assets(active_driver)
+    # In-page loops such as the Show More clicks run as one async script.
+    active_driver.set_script_timeout(_SCRIPT_TIMEOUT_SECONDS)
+
+
+def _hide_webdriver_flag(active_driver: webdriver.Chrome):
+    active_driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument",
+        {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"},
+    )
+
+
+def _block_heavy_assets(active_driver: webdriver.Chrome):
+    """Stop the tab fetching images, fonts, media and analytics that automation never looks at."""
+    active_driver.execute_cdp_cmd("Network.enable", {})
+    active_driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URLS)})
+
+
+def _start_chrome(options: ChromeOptions) -> webdriver.Chrome:
+    """
+    Create a Chrome WebDriver, resolving a chromedriver binary as needed.
+    The binary that worked is remembered, so later sessions skip the resolution.
+    """
+    global _resolved_driver_path
+    if _resolved_driver_path and os.path.exists(_resolved_driver_path):
+        try:
+            return webdriver.Chrome(service=Service(_resolved_driver_path), options=options)
+        except WebDriverException as exc:
+            logger.debug(f"Cached Chrome driver {_resolved_driver_path} failed; resolving again: {exc}")
+            _resolved_driver_path = None
+
+    new_driver = _start_chrome_uncached(options)
+    _resolved_driver_path = new_driver.service.path
+    return new_driver
+
+
+def _start_chrome_uncached(options: ChromeOptions) -> webdriver.Chrome:
+    env_driver_path = os.getenv("CHROME_DRIVER_PATH")
+
+    if env_driver_path and os.path.exists(env_driver_path):
+        service = Service(env_driver_path)
+        new_driver = webdriver.Chrome(service=service, options=options)
+    else:
+        try:
+            # Let Selenium Manager locate/download a matching driver for the installed browser.
+            new_driver = webdriver.Chrome(options=options)
+        except WebDriverException:
+            chromedriver_path = _latest_chromedriver_path()
+            if chromedriver_path and os.path.exists(chromedriver_path):
+                service = Service(chromedriver_path)
+                new_driver = webdriver.Chrome(service=service, options=options)
+            else:
+                logger.info("Falling back to webdriver_manager for Chrome driver installation.")
+                # Last-resort path only, so its import cost is not paid on every start.
+                from webdriver_manager.chrome import ChromeDriverManager
+
+                service = Service(ChromeDriverManager().install())
+                new_driver = webdriver.Chrome(service=service, options=options)
+    return new_driver
 
 
 async def shutdown_browser():
     """Close Selenium and clean up resources."""
     global driver
-    if driver:
-        driver.quit()
-        driver = None
-        logger.info("Browser session terminated.")
+    browser_ready.clear()
+    drivers = pool.clear()
+    if driver and driver not in drivers:
+        drivers.append(driver)
+    primary, driver = driver, None
+    if drivers:
+        await asyncio.to_thread(_quit_drivers, drivers, primary)
+        logger.info(f"Browser session terminated ({len(drivers)} closed).")
+
+
+def _quit_drivers(drivers: List[webdriver.Chrome], primary: Optional[webdriver.Chrome]):
+    # Detach the pooled tabs first; quitting the primary then closes the browser.
+    for pooled_driver in sorted(drivers, key=lambda item: item is primary):
+        try:
+            if pooled_driver is primary:
+                pooled_driver.quit()
+            else:
+                _close_tab(pooled_driver)
+        except WebDriverException as exc:
+            logger.warning(f"Failed to quit browser session cleanly: {exc}")
 
 
-def _inject_real_debrid_tokens():
-    """Insert Real-Debrid credentials into local storage for the current session."""
-    if not driver:
-        return
-    driver.execute_script(
-        """
-        localStorage.setItem('rd:accessToken', arguments[0]);
-        localStorage.setItem('rd:clientId', arguments[1]);
-        localStorage.setItem('rd:clientSecret', arguments[2]);
-        localStorage.setItem('rd:refreshToken', arguments[3]);
-        """,
-        RD_ACCESS_TOKEN,
-        f'"{RD_CLIENT_ID}"',
-        f'"{RD_CLIENT_SECRET}"',
-        f'"{RD_REFRESH_TOKEN}"',
-    )
-    driver.refresh()
+def install_real_debrid_tokens(active_driver, *, update_current_page: bool = False) -> bool:
+    """
+    Register the current Real-Debrid credentials to be written to DMM's local
+    storage before any page script runs, replacing a previously registered set.
+    With update_current_page=True the already-loaded page is updated as well.
+
+    Returns True if the current page's local storage changed; the next navigation loads
+    with the new credentials.
+    """
+    tokens = (config.RD_ACCESS_TOKEN, config.RD_CLIENT_ID, config.RD_CLIENT_SECRET, config.RD_REFRESH_TOKEN)
+    previous = _token_scripts.get(active_driver)
+    if previous is None or previous[1] != tokens:
+        if previous:
+            active_driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": previous[0]})
+        source = (
+            f"if (location.origin === 'https://debridmediamanager.com') "
+            f"(function () {{{_RD_TOKENS_JS}}}).apply(null, {json.dumps(tokens)});"
+        )
+        result = active_driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        _token_scripts[active_driver] = (result["identifier"], tokens)
+    if update_current_page:
+        return bool(active_driver.execute_script(_RD_TOKENS_JS, *tokens))
+    return False
 
 
-def login(active_driver):
-    """Click the Real-Debrid login button when present."""
+def login(active_driver, timeout: float = 3):
+    """Click the Real-Debrid login button when the current page shows it."""
     try:
-        button = WebDriverWait(active_driver, 5).until(
-            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Login with Real Debrid')]"))
+        button = WebDriverWait(active_driver, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, _LOGIN_BUTTON_XPATH))
         )
         button.click()
         logger.info("Clicked 'Login with Real Debrid'.")
@@ -300,65 +857,70 @@ def login(active_driver):
         logger.debug("Login button not visible; assuming session already authenticated.")
 
 
-def apply_size_limits(max_movie_size: str, max_episode_size: str):
+def apply_size_limits(max_movie_size: str, max_episode_size: str, active_driver=None):
     """
     Apply the configured movie and episode size limits on the settings page.
+    Uses the primary session unless another driver is given.
     Raises RuntimeError if the browser session is unavailable.
     """
-    if not driver:
+    active_driver = active_driver or driver
+    if not active_driver:
         raise RuntimeError("Browser driver is not initialized.")
 
     last_exc: Exception | None = None
     for attempt in range(1, 4):
         try:
-            driver.get("https://debridmediamanager.com/settings")
-            wait = WebDriverWait(driver, 20)
+            active_driver.get("https://debridmediamanager.com/settings")
+            wait = WebDriverWait(active_driver, 20)
 
-            # If the session needs re-auth, try clicking the login button.
-            try:
-                login_button = WebDriverWait(driver, 3).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Login with Real Debrid')]"))
-                )
-                login_button.click()
-                logger.info("Clicked 'Login with Real Debrid' from settings page.")
-            except TimeoutException:
-                pass
-
-            movie_select = wait.until(EC.element_to_be_clickable((By.ID, "dmm-movie-max-size")))
-            episode_select = wait.until(EC.element_to_be_clickable((By.ID, "dmm-episode-max-size")))
-
-            Select(movie_select).select_by_value(str(max_movie_size))
-            Select(episode_select).select_by_value(str(max_episode_size))
+            login(active_driver)
+
+            wait.until(EC.element_to_be_clickable((By.ID, "dmm-episode-max-size")))
+            missing = active_driver.execute_script(
+                _SET_SIZE_LIMITS_JS, str(max_movie_size), str(max_episode_size)
+            )
+            if missing:
+                raise NoSuchElementException(f"Size option not available in #{missing}")
             logger.success(f"Applied movie size {max_movie_size} GB and episode size {max_episode_size} GB.")
-            save_debug_screenshot("dmm-settings-applied")
+            save_debug_screenshot("dmm-settings-applied", active_driver)
             return
         except (TimeoutException, WebDriverException) as exc:
             last_exc = exc
             logger.warning(f"Failed to apply size limits (attempt {attempt}/3): {exc!r}")
-            save_debug_screenshot(f"dmm-settings-failed-{attempt}")
+            save_debug_screenshot(f"dmm-settings-failed-{attempt}", active_driver)
             time.sleep(2)
 
     raise RuntimeError("Failed to apply size limits after retries.") from last_exc
 
 
 def click_show_more_results(active_driver, attempts: int = 3, wait_between: int = 5):
-    """Click the 'Show More Results' button multiple times when it is available."""
-    for attempt in range(attempts):
-        try:
-            button = WebDriverWait(active_driver, 5).until(
-                EC.element_to_be_clickable(
-                    (By.XPATH, "//button[contains(text(), 'Show More Results')]")
-                )
-            )
-            button.click()
-            logger.debug(f"Clicked 'Show More Results' ({attempt + 1}/{attempts}).")
-            time.sleep(wait_between)
-        except TimeoutException:
-            logger.debug(f"No 'Show More Results' button found on attempt {attempt + 1}.")
-            break
-        except ElementClickInterceptedException as exc:
-            logger.warning(f"Failed to click 'Show More Results': {exc}")
-            break
+    """
+    Click the 'Show More Results' button multiple times when it is available.
+    After each click, waits up to `wait_between` seconds for new result cards.
+    The whole loop runs in the page as a single async script.
+    """
+    try:
+        clicks = active_driver.execute_async_script(
+            _SHOW_MORE_LOOP_JS, _RESULT_CARD_CSS, attempts, 5000, wait_between * 1000
+        )
+    except WebDriverException as exc:
+        logger.warning(f"Failed to click 'Show More Results': {exc}")
+        return
+    logger.debug(f"Clicked 'Show More Results' {clicks}/{attempts} time(s).")
+
+
+def wait_for_result_cards(active_driver, timeout: float = 10.0, stable_for: float = 1.0) -> int:
+    """
+    Wait until the result grid has cards and their count stops changing for `stable_for`
+    seconds, giving up after `timeout` seconds. Returns the number of cards seen.
+    """
+    try:
+        return active_driver.execute_async_script(
+            _WAIT_CARDS_STABLE_JS, _RESULT_CARD_CSS, int(stable_for * 1000), int(timeout * 1000)
+        )
+    except WebDriverException as exc:
+        logger.warning(f"Failed waiting for result cards: {exc}")
+        return 0
 
 
 def _focus_search_input(active_driver):
@@ -366,105 +928,74 @@ def _focus_search_input(active_driver):
 
 
 def set_search_query(active_driver, text: str, wait_after: float = 2.0):
-    """Clear the search bar and type the provided text."""
+    """
+    Clear the search bar and type the provided text.
+    Returns once the results stop changing (or the grid is shown and did not change),
+    at most `wait_after` seconds.
+    """
     try:
         input_box = _focus_search_input(active_driver)
+        active_driver.execute_script(_WATCH_RESULTS_JS)
         input_box.click()
         input_box.send_keys(Keys.CONTROL, "a")
         input_box.send_keys(Keys.DELETE)
         input_box.send_keys(text)
         input_box.send_keys(Keys.ENTER)
-        time.sleep(wait_after)
+        quiet_ms = 250
+        idle_ms = 500
+        if not active_driver.execute_async_script(
+            _WAIT_RESULTS_SETTLED_JS, quiet_ms, idle_ms, int(wait_after * 1000), _RESULT_GRID_CSS
+        ):
+            logger.debug(f"Could not confirm results settled after searching '{text}'.")
     except Exception as exc:
-        save_debug_screenshot(f"set-search-query-failed")
+        save_debug_screenshot(f"set-search-query-failed", active_driver)
         logger.error(f"Failed to type search query '{text}': {exc}")
         raise
 
 
-def has_rd_100_result(active_driver, timeout: float = 2.0) -> bool:
+def wait_for_rd_100_result(active_driver, timeout: float = 7.0) -> bool:
     """
-    Return True if there is an 'RD (100%)' match that is not a "Single" result card.
-
-    Valid cards are those labelled as "Complete ..." or "With extras ...".
+    After an Instant RD click, wait up to `timeout` seconds for a valid 'RD (100%)'
+    card to appear. Polls inside the page, so it returns as soon as one shows up.
     """
     try:
-        grid_xpath = (
-            "//div[contains(@class,'grid-cols-1') and contains(@class,'gap-2') and contains(@class,'overflow-x-auto')]"
-        )
-        grid = WebDriverWait(active_driver, timeout).until(EC.presence_of_element_located((By.XPATH, grid_xpath)))
-
-        rd_elements = grid.find_elements(By.XPATH, ".//*[contains(normalize-space(), 'RD (100%)')]")
-        if not rd_elements:
-            return False
-
-        card_xpath = "ancestor::div[contains(@class,'overflow-hidden') and contains(@class,'rounded-lg')][1]"
-        status_xpath = (
-            ".//span[starts-with(normalize-space(),'Single') "
-            "or starts-with(normalize-space(),'Complete') "
-            "or starts-with(normalize-space(),'With extras') "
-            "or starts-with(normalize-space(),'With Extras')]"
+        found = active_driver.execute_async_script(
+            _WAIT_RD_100_JS, _RESULT_GRID_CSS, _CARD_CSS, int(timeout * 1000)
         )
-
-        for rd_el in rd_elements:
-            try:
-                card = rd_el.find_element(By.XPATH, card_xpath)
-            except NoSuchElementException:
-                continue
-
-            status_texts = []
-            for el in card.find_elements(By.XPATH, status_xpath):
-                text = (el.text or "").strip()
-                if text:
-                    status_texts.append(text)
-
-            if any(text.startswith("Single") for text in status_texts):
-                logger.debug("Found an 'RD (100%)' match on a Single card; ignoring.")
-                save_debug_screenshot("found-rd-100-single-ignored")
-                continue
-
-            if any(text.startswith("Complete") for text in status_texts) or any(
-                text.lower().startswith("with extras") for text in status_texts
-            ):
-                logger.debug("Found a valid 'RD (100%)' result (Complete/With extras).")
-                save_debug_screenshot("found-rd-100-valid")
-                return True
-
-            logger.debug("Found an 'RD (100%)' match but could not validate card status; ignoring.")
-            save_debug_screenshot("found-rd-100-unvalidated-ignored")
-
-        return False
-    except TimeoutException:
+    except WebDriverException as exc:
+        logger.warning(f"Failed waiting for an 'RD (100%)' result: {exc}")
         return False
+    if found:
+        logger.debug("Found a valid 'RD (100%)' result (Complete/With extras).")
+        save_debug_screenshot("found-rd-100-valid", active_driver)
+    return bool(found)
 
 
-def click_instant_rd_button(active_driver, *, whole_season: bool = False, timeout: float = 3.0) -> bool:
-    """Click the top banner Instant RD buttons shown in the screenshots."""
-    if whole_season:
-        xpath = (
-            "//button[contains(@class, 'mb-1') and contains(normalize-space(), 'Instant RD') "
-            "and contains(normalize-space(), 'Whole Season')]"
-        )
-        label = "Instant RD (Whole Season)"
-    else:
-        xpath = (
-            "//button[contains(@class, 'mb-1') and contains(normalize-space(), 'Instant RD') "
-            "and not(contains(normalize-space(), 'Whole Season'))]"
-        )
-        label = "Instant RD"
-    safe_label = "".join(ch if ch.isalnum() else "-" for ch in label.lower())
-
+def find_rd_100_or_click_instant_rd(
+    active_driver, *, whole_season: bool = False, timeout: float = 3.0
+) -> Tuple[bool, bool]:
+    """
+    Check for a valid RD (100%) card and otherwise click the top banner Instant RD
+    button, in one script per poll.
+    Returns (found_rd_100, clicked_instant_rd); the button is only clicked when no
+    valid 'RD (100%)' card is present.
+    """
+    label = _INSTANT_RD_LABELS[whole_season]
     try:
-        button = WebDriverWait(active_driver, timeout).until(EC.element_to_be_clickable((By.XPATH, xpath)))
-        button.click()
-        logger.info(f"Clicked '{label}' button.")
-        return True
+        outcome = WebDriverWait(active_driver, timeout).until(
+            lambda d: d.execute_script(_RD_100_OR_INSTANT_RD_JS, _RESULT_GRID_CSS, _CARD_CSS, whole_season)
+        )
     except TimeoutException:
-        logger.debug(f"No '{label}' button available.")
-        save_debug_screenshot(f"missing-{safe_label}")
-        return False
-    except ElementClickInterceptedException as exc:
-        logger.warning(f"Unable to click '{label}': {exc}")
-        return False
+        logger.debug(f"No valid 'RD (100%)' result and no '{label}' button available.")
+        save_debug_screenshot(f"missing-{label}", active_driver)
+        return False, False
+
+    if outcome["found"]:
+        logger.debug("Found a valid 'RD (100%)' result (Complete/With extras).")
+        save_debug_screenshot("found-rd-100-valid", active_driver)
+        return True, False
+    logger.info(f"Clicked '{label}' button.")
+    return False, True
 
 
 def ensure_with_extras_filter(active_driver, timeout: float = 5.0) -> bool:
@@ -472,9 +1003,10 @@ def ensure_with_extras_filter(active_driver, timeout: float = 5.0) -> bool:
     Ensure the "With extras" filter chip is enabled.
     Returns True if the chip is present (enabled or successfully clicked), else False.
     """
-    xpath = "//span[normalize-space()='With extras' or normalize-space()='With Extras']"
     try:
-        chip = WebDriverWait(active_driver, timeout).until(EC.presence_of_element_located((By.XPATH, xpath)))
+        chip = WebDriverWait(active_driver, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, _WITH_EXTRAS_CHIP_XPATH))
+        )
     except TimeoutException:
         logger.debug("No 'With extras' filter chip found.")
         return False
@@ -484,13 +1016,14 @@ def ensure_with_extras_filter(active_driver, timeout: float = 5.0) -> bool:
         return True
 
     try:
-        chip = WebDriverWait(active_driver, timeout).until(EC.element_to_be_clickable((By.XPATH, xpath)))
-        chip.click()
-        time.sleep(1)
-        return True
+        # Returns as soon as the chip's class flips instead of sleeping a fixed second.
+        if active_driver.execute_async_script(_CLICK_AND_WATCH_CLASS_JS, chip, 2000):
+            return True
+        logger.debug("'With extras' chip class did not change within 2s of the click.")
+        return "bg-blue-900" in (chip.get_attribute("class") or "").lower()
     except Exception as exc:
         logger.warning(f"Failed to enable 'With extras' filter chip: {exc!r}")
-        save_debug_screenshot("with-extras-click-failed")
+        save_debug_screenshot("with-extras-click-failed", active_driver)
         return False
 
 
@@ -499,28 +1032,19 @@ def click_first_instant_rd_in_result_cards(active_driver, timeout: float = 5.0)
     Click the first "Instant RD" button inside the result card grid.
     This intentionally does not use the top banner buttons.
     """
-    grid_xpath = (
-        "//div[contains(@class,'grid-cols-1') and contains(@class,'gap-2') and contains(@class,'overflow-x-auto')]"
-    )
     try:
-        grid = WebDriverWait(active_driver, timeout).until(EC.presence_of_element_located((By.XPATH, grid_xpath)))
-        buttons = grid.find_elements(By.XPATH, ".//button[.//b[normalize-space()='Instant RD']]")
-        for button in buttons:
-            try:
-                if not button.is_displayed():
-                    continue
-                active_driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                WebDriverWait(active_driver, timeout).until(lambda d: button.is_enabled())
-                button.click()
-                logger.info("Clicked 'Instant RD' from result card grid.")
-                return True
-            except Exception:
-                continue
+        # Finding, scrolling to and clicking the button happens in one in-page script.
+        outcome = WebDriverWait(active_driver, timeout).until(
+            lambda d: d.execute_script(_CLICK_CARD_INSTANT_RD_JS, _RESULT_GRID_CSS)
+        )
+        if outcome == "clicked":
+            logger.info("Clicked 'Instant RD' from result card grid.")
+            return True
 
         logger.debug("No 'Instant RD' buttons found inside result card grid.")
-        save_debug_screenshot("no-instant-rd-in-cards")
+        save_debug_screenshot("no-instant-rd-in-cards", active_driver)
         return False
     except TimeoutException:
         logger.debug("Result card grid not found.")
-        save_debug_screenshot("missing-result-grid")
+        save_debug_screenshot("missing-result-grid", active_driver)
         return False
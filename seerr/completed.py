@@ -0,0 +1,88 @@
+"""
+Persistent record of media already confirmed complete on Debrid Media Manager.
+
+Overseerr keeps a request pending until the media server picks the files up,
+so the same titles come back on every job tick. Once a movie or season reached
+an RD (100%) result it is skipped until the entry expires.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional
+
+from loguru import logger
+
+from seerr import config
+
+# Movies and seasons finish from different worker threads when the browser pool is used.
+_lock = threading.Lock()
+# key -> wall-clock time it was confirmed; loaded from disk on first use.
+_entries: Optional[Dict[str, float]] = None
+
+
+def movie_key(imdb_id: str) -> str:
+    return imdb_id
+
+
+def season_key(imdb_id: str, season: int) -> str:
+    return f"{imdb_id}:{season}"
+
+
+def is_completed(key: str) -> bool:
+    """True if `key` was confirmed complete within COMPLETED_CACHE_TTL_HOURS."""
+    ttl = config.COMPLETED_CACHE_TTL_HOURS * 3600
+    if ttl <= 0:
+        return False
+    with _lock:
+        confirmed_at = _load().get(key)
+    return confirmed_at is not None and time.time() - confirmed_at < ttl
+
+
+def record_completed(key: str):
+    """Remember `key` as complete and persist the cache, dropping expired entries."""
+    ttl = config.COMPLETED_CACHE_TTL_HOURS * 3600
+    if ttl <= 0:
+        return
+    now = time.time()
+    with _lock:
+        entries = _load()
+        entries[key] = now
+        for stale_key in [k for k, confirmed_at in entries.items() if now - confirmed_at >= ttl]:
+            del entries[stale_key]
+        _save(entries)
+
+
+def _load() -> Dict[str, float]:
+    global _entries
+    if _entries is None:
+        try:
+            with open(config.COMPLETED_CACHE_FILE, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            _entries = {str(key): float(value) for key, value in data.items()}
+        except FileNotFoundError:
+            _entries = {}
+        except (OSError, ValueError, TypeError, AttributeError) as exc:
+            logger.warning(f"Ignoring unreadable completed-media cache {config.COMPLETED_CACHE_FILE}: {exc}")
+            _entries = {}
+    return _entries
+
+
+def _save(entries: Dict[str, float]):
+    path = config.COMPLETED_CACHE_FILE
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".completed.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entries, handle)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+    except OSError as exc:
+        logger.warning(f"Failed to write completed-media cache {path}: {exc}")
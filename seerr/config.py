@@ -6,15 +6,19 @@ import os
 import sys
 import json
 import time
+import shutil
+import tempfile
 from typing import Optional
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from loguru import logger
 
 # Configure loguru
+# Both sinks write from loguru's background thread (enqueue=True), so callers on the
+# event loop or in Selenium workers don't wait on file/console I/O.
 logger.remove()  # Remove default handler
-logger.add("logs/seerrbridge.log", rotation="500 MB", encoding='utf-8')  # Use utf-8 encoding for log file
-logger.add(sys.stdout, colorize=True)  # Ensure stdout can handle Unicode
+logger.add("logs/seerrbridge.log", rotation="500 MB", encoding='utf-8', enqueue=True)  # Use utf-8 encoding for log file
+logger.add(sys.stdout, colorize=True, enqueue=True)  # Ensure stdout can handle Unicode
 logger.level("WARNING", color="<cyan>")
 logger.level("DEBUG", color="<yellow>")
 
@@ -31,6 +35,15 @@ HEADLESS_MODE = True
 MAX_MOVIE_SIZE = None
 MAX_EPISODE_SIZE = None
 JOB_INTERVAL_SECONDS = 180
+BROWSER_POOL_SIZE = 1
+SCREENSHOTS_ENABLED = True
+SCREENSHOTS_DIR = os.path.join("logs", "screenshots")
+SCREENSHOTS_MAX_KEEP = 10
+COMPLETED_CACHE_FILE = os.path.join("logs", "completed_media.json")
+COMPLETED_CACHE_TTL_HOURS = 24.0
+# Persistent Chrome profile: keeps the RD localStorage and DMM's asset cache across restarts.
+_DEFAULT_CHROME_PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chromedriver", "profile")
+CHROME_PROFILE_DIR = _DEFAULT_CHROME_PROFILE_DIR
 
 # Add a global variable to track start time
 START_TIME = datetime.now()
@@ -40,6 +53,8 @@ def load_config(override: bool = False):
     global RD_ACCESS_TOKEN, RD_REFRESH_TOKEN, RD_CLIENT_ID, RD_CLIENT_SECRET
     global OVERSEERR_BASE, OVERSEERR_API_BASE_URL, OVERSEERR_API_KEY, TRAKT_API_KEY
     global HEADLESS_MODE, MAX_MOVIE_SIZE, MAX_EPISODE_SIZE, JOB_INTERVAL_SECONDS
+    global BROWSER_POOL_SIZE, SCREENSHOTS_ENABLED, SCREENSHOTS_DIR, SCREENSHOTS_MAX_KEEP
+    global COMPLETED_CACHE_FILE, COMPLETED_CACHE_TTL_HOURS, CHROME_PROFILE_DIR
     
     # Load environment variables
     load_dotenv(override=override)
@@ -65,6 +80,28 @@ def load_config(override: bool = False):
     except (TypeError, ValueError):
         logger.error("JOB_INTERVAL_SECONDS is not a valid integer. Falling back to 180 seconds.")
         JOB_INTERVAL_SECONDS = 180
+
+    try:
+        BROWSER_POOL_SIZE = max(1, int(os.getenv("BROWSER_POOL_SIZE", "1")))
+    except (TypeError, ValueError):
+        logger.error("BROWSER_POOL_SIZE is not a valid integer. Falling back to 1.")
+        BROWSER_POOL_SIZE = 1
+
+    CHROME_PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR") or _DEFAULT_CHROME_PROFILE_DIR
+
+    SCREENSHOTS_ENABLED = os.getenv("SCREENSHOTS_ENABLED", "true").lower() == "true"
+    SCREENSHOTS_DIR = os.getenv("SCREENSHOTS_DIR") or os.path.join("logs", "screenshots")
+    try:
+        SCREENSHOTS_MAX_KEEP = int(os.getenv("SCREENSHOTS_MAX_KEEP", "10"))
+    except ValueError:
+        SCREENSHOTS_MAX_KEEP = 10
+
+    COMPLETED_CACHE_FILE = os.getenv("COMPLETED_CACHE_FILE") or os.path.join("logs", "completed_media.json")
+    try:
+        COMPLETED_CACHE_TTL_HOURS = float(os.getenv("COMPLETED_CACHE_TTL_HOURS", "24"))
+    except ValueError:
+        logger.error("COMPLETED_CACHE_TTL_HOURS is not a number. Falling back to 24 hours.")
+        COMPLETED_CACHE_TTL_HOURS = 24.0
     
     # Validate required configuration
     if not OVERSEERR_API_BASE_URL:
@@ -84,6 +121,30 @@ def load_config(override: bool = False):
 # Initialize configuration
 load_config()
 
+def _replace_file(path: str, content: str):
+    """
+    Write `content` to a temp file next to `path` and swap it in with os.replace,
+    so a crash mid-write never leaves a truncated file. A .env bind-mounted into a
+    container can't be replaced, so that case falls back to an in-place write.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.env.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as tmp:
+            tmp.write(content)
+        shutil.copymode(path, tmp_path)
+        try:
+            os.replace(tmp_path, path)
+            return
+        except OSError:
+            pass
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(content)
+
 def update_env_file():
     """Update the .env file with the new access token."""
     try:
@@ -107,13 +168,12 @@ def update_env_file():
 
         with open(env_file_path, 'r', encoding='utf-8') as file:
             lines = file.readlines()
-        
-        with open(env_file_path, 'w', encoding='utf-8') as file:
-            for line in lines:
-                if line.startswith('RD_ACCESS_TOKEN'):
-                    file.write(f'RD_ACCESS_TOKEN={RD_ACCESS_TOKEN}\n')
-                else:
-                    file.write(line)
+
+        token_line = f'RD_ACCESS_TOKEN={RD_ACCESS_TOKEN}\n'
+        patched = [token_line if line.startswith('RD_ACCESS_TOKEN') else line for line in lines]
+        if patched == lines:
+            return True
+        _replace_file(env_file_path, ''.join(patched))
         return True
     except Exception as e:
         logger.error(f"Error updating .env file: {e}")
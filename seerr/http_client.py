@@ -0,0 +1,40 @@
+"""
+Shared async HTTP client for outbound API calls.
+"""
+from __future__ import annotations
+
+import importlib.util
+from typing import Optional
+
+import httpx
+from loguru import logger
+
+_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+# HTTP/2 lets concurrent Trakt lookups share one connection; it needs the h2 extra.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(timeout=10.0, limits=_LIMITS, http2=_HTTP2)
+    return _client
+
+
+async def open_client() -> httpx.AsyncClient:
+    """Create the shared client up front (called from the app lifespan)."""
+    client = get_client()
+    logger.debug("Shared HTTP client ready.")
+    return client
+
+
+async def close_client():
+    """Close the shared client and release its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.debug("Shared HTTP client closed.")
@@ -2,14 +2,21 @@
 Overseerr integration module
 Handles interaction with the Overseerr API
 """
+import asyncio
 import json
-import requests
+import httpx
+import orjson
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
-from seerr.config import OVERSEERR_API_BASE_URL, OVERSEERR_API_KEY
+from seerr import config
+from seerr.http_client import get_client
+from seerr.trakt import get_media_details_from_trakt
 
 AVAILABLE_MEDIA_STATUSES = {4, 5}
+REQUESTS_PAGE_SIZE = 100
+# Same ceiling as the single take=500 call the listing used to make.
+REQUESTS_MAX_ROWS = 500
 STATUS_LABELS = {
     1: "UNKNOWN",
     2: "APPROVED",
@@ -19,9 +26,11 @@ STATUS_LABELS = {
 }
 
 _TITLE_CACHE: dict[tuple[str, int], str] = {}
+# Identity of the pending set last written by log_pending_summary.
+_last_summary_key: Optional[tuple] = None
 
 
-def _resolve_title(media: dict, media_type: str, tmdb_id: Any) -> str:
+async def _resolve_title(media: dict, media_type: str, tmdb_id: Any) -> str:
     """
     Overseerr's /request endpoint doesn't always include a title/name on the media object.
     For logging, fall back to a Trakt lookup when needed.
@@ -41,79 +50,121 @@ def _resolve_title(media: dict, media_type: str, tmdb_id: Any) -> str:
         return cached
 
     try:
-        from seerr.trakt import get_media_details_from_trakt
-
-        details = get_media_details_from_trakt(str(tmdb_int), media_type.lower())
+        details = await get_media_details_from_trakt(str(tmdb_int), media_type.lower())
         resolved = (details or {}).get("title") or "Untitled"
         _TITLE_CACHE[cache_key] = resolved
         return resolved
     except Exception:
         return "Untitled"
 
-def get_overseerr_media_requests() -> list[dict]:
+async def prewarm_overseerr() -> None:
+    """
+    Open a pooled connection to Overseerr ahead of the first real call, so the
+    first job or webhook doesn't pay the DNS lookup and TLS handshake inline.
+    """
+    try:
+        await get_client().get(f"{config.OVERSEERR_API_BASE_URL}/status")
+        logger.debug("Overseerr connection warmed up.")
+    except httpx.HTTPError as e:
+        logger.debug(f"Overseerr warm-up failed: {e}")
+
+async def get_overseerr_media_requests() -> list[dict]:
     """
     Fetch pending media requests from Overseerr.
-    Only requests whose media status is neither AVAILABLE nor PARTIALLY_AVAILABLE are returned.
+    Overseerr's "processing" filter narrows the listing to approved requests whose
+    media is not yet available; AVAILABLE and PARTIALLY_AVAILABLE media are still
+    dropped here in case the server-side filter lets one through.
     
     Returns:
         list[dict]: List of media request objects
     """
-    url = f"{OVERSEERR_API_BASE_URL}/request?take=500&filter=approved&sort=added"
+    url = f"{config.OVERSEERR_API_BASE_URL}/request"
     headers = {
-        "X-Api-Key": OVERSEERR_API_KEY
+        "X-Api-Key": config.OVERSEERR_API_KEY
     }
     
     try:
-        response = requests.get(url, headers=headers)
-        
-        if response.status_code != 200:
-            logger.error(f"Failed to fetch requests from Overseerr: {response.status_code}")
-            return []
-        
-        data = response.json()
-        logger.info(f"Fetched {len(data.get('results', []))} requests from Overseerr")
-        
-        results = data.get('results', [])
-        if not results:
-            return []
-
-        pending = []
-        for item in results:
-            media = item.get('media') or {}
-            if media.get('status') in AVAILABLE_MEDIA_STATUSES:
-                continue
-            pending.append(item)
-
-        logger.info(f"Filtered {len(pending)} pending Overseerr request(s).")
-        if pending:
-            summary = _format_pending_summary(pending)
-            logger.info(f"Pending Overseerr media:\n{summary}")
+        pending = [
+            item
+            async for item in _iter_processing_requests(url, headers)
+            if (item.get('media') or {}).get('status') not in AVAILABLE_MEDIA_STATUSES
+        ]
+        logger.debug(f"Fetched {len(pending)} pending Overseerr request(s).")
         return pending
     except Exception as e:
         logger.error(f"Error fetching media requests from Overseerr: {e}")
         return []
 
-def _format_pending_summary(items: List[dict]) -> str:
+async def _iter_processing_requests(url: str, headers: dict):
+    """
+    Yield processing requests page by page, stopping at the last page Overseerr
+    reports or after REQUESTS_MAX_ROWS rows.
+    """
+    client = get_client()
+    for skip in range(0, REQUESTS_MAX_ROWS, REQUESTS_PAGE_SIZE):
+        params = {"take": REQUESTS_PAGE_SIZE, "skip": skip, "filter": "processing", "sort": "added"}
+        response = await client.get(url, headers=headers, params=params)
+        if response.status_code != 200:
+            raise RuntimeError(f"Failed to fetch requests from Overseerr: {response.status_code}")
+
+        data = orjson.loads(response.content)
+        rows = data.get("results") or []
+        for row in rows:
+            yield row
+        total = (data.get("pageInfo") or {}).get("results")
+        if len(rows) < REQUESTS_PAGE_SIZE or (isinstance(total, int) and skip + len(rows) >= total):
+            break
+
+async def log_pending_summary(items: List[dict]) -> None:
+    """
+    Log the pending Overseerr media.
+    Missing titles are looked up on Trakt concurrently rather than one request at a time.
+    The summary is skipped while the pending set is the same as the last one logged.
+    """
+    global _last_summary_key
+    if not items:
+        return
+    key = tuple(sorted(_summary_key(item) for item in items))
+    if key == _last_summary_key:
+        logger.debug(f"Pending Overseerr media unchanged ({len(items)} item(s)).")
+        return
+    titles = await asyncio.gather(*(_item_title(item) for item in items))
+    logger.info(f"Pending Overseerr media:\n{_format_pending_summary(items, titles)}")
+    _last_summary_key = key
+
+def _summary_key(item: dict) -> tuple:
+    media = item.get("media") or {}
+    seasons = tuple(season.get("seasonNumber") for season in item.get("seasons") or ())
+    return (str(item.get("id")), media.get("status"), str(media.get("tmdbId")), seasons)
+
+async def _item_title(item: dict) -> str:
+    media = item.get("media") or {}
+    media_type = (media.get("mediaType") or "unknown").upper()
+    return await _resolve_title(media, media_type, media.get("tmdbId", "n/a"))
+
+def _format_pending_summary(items: List[dict], titles: List[str]) -> str:
     lines = []
-    for item in items:
+    status_label_for = STATUS_LABELS.get
+    for item, title in zip(items, titles):
         media = item.get("media") or {}
         media_type = (media.get("mediaType") or "unknown").upper()
         status_code = media.get("status")
-        status_label = STATUS_LABELS.get(status_code, f"STATUS_{status_code}")
+        status_label = status_label_for(status_code, f"STATUS_{status_code}")
         tmdb_id = media.get("tmdbId", "n/a")
-        title = _resolve_title(media, media_type, tmdb_id)
         request_id = item.get("id", "n/a")
 
         season_suffix = ""
-        if media_type == "TV" and item.get("seasons"):
-            season_numbers = [str(season.get("seasonNumber")) for season in item["seasons"] if season.get("seasonNumber") is not None]
-            if season_numbers:
-                season_suffix = f" | seasons: {', '.join(season_numbers)}"
+        if media_type == "TV":
+            joined = ", ".join(
+                str(season["seasonNumber"]) for season in item.get("seasons") or () if season.get("seasonNumber") is not None
+            )
+            if joined:
+                season_suffix = f" | seasons: {joined}"
 
         lines.append(f"- [{media_type}][{status_label}] {title} (request {request_id}, TMDB {tmdb_id}){season_suffix}")
     return "\n".join(lines)
 
-def get_media_id_from_request_id(request_id: int) -> Optional[int]:
+async def get_media_id_from_request_id(request_id: int) -> Optional[int]:
     """
     Get the media_id from a request_id by fetching the request details from Overseerr
     
@@ -123,23 +174,23 @@ def get_media_id_from_request_id(request_id: int) -> Optional[int]:
     Returns:
         Optional[int]: Media ID if found, None otherwise
     """
-    url = f"{OVERSEERR_API_BASE_URL}/request/{request_id}"
+    url = f"{config.OVERSEERR_API_BASE_URL}/request/{request_id}"
     headers = {
-        "X-Api-Key": OVERSEERR_API_KEY
+        "X-Api-Key": config.OVERSEERR_API_KEY
     }
     
     try:
-        response = requests.get(url, headers=headers)
+        response = await get_client().get(url, headers=headers)
         
         if response.status_code != 200:
             logger.error(f"Failed to fetch request {request_id} from Overseerr: {response.status_code}")
             return None
         
-        data = response.json()
+        data = orjson.loads(response.content)
         media_id = data.get('media', {}).get('id')
         
         if media_id:
-            logger.info(f"Found media_id {media_id} for request_id {request_id}")
+            logger.debug(f"Found media_id {media_id} for request_id {request_id}")
             return media_id
         else:
             logger.error(f"No media_id found in request {request_id} response")
@@ -149,7 +200,7 @@ def get_media_id_from_request_id(request_id: int) -> Optional[int]:
         logger.error(f"Error fetching request {request_id} from Overseerr: {e}")
         return None
 
-def mark_completed(media_id: int, tmdb_id: int) -> bool:
+async def mark_completed(media_id: int, tmdb_id: int) -> bool:
     """
     Mark an item as completed in Overseerr
     
@@ -160,15 +211,15 @@ def mark_completed(media_id: int, tmdb_id: int) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    url = f"{OVERSEERR_API_BASE_URL}/media/{media_id}/available"
+    url = f"{config.OVERSEERR_API_BASE_URL}/media/{media_id}/available"
     headers = {
-        "X-Api-Key": OVERSEERR_API_KEY,
+        "X-Api-Key": config.OVERSEERR_API_KEY,
         "Content-Type": "application/json"
     }
     data = {"is4k": False}
     
     try:
-        response = requests.post(url, headers=headers, json=data)
+        response = await get_client().post(url, headers=headers, json=data)
         response_data = response.json()  # Parse the JSON response
         
         if response.status_code == 200:
@@ -182,7 +233,7 @@ def mark_completed(media_id: int, tmdb_id: int) -> bool:
         else:
             logger.error(f"Failed to mark media as completed in overseerr with id {media_id}: Status code {response.status_code}, Response: {response_data}")
             return False
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Failed to mark media as completed in overseerr with id {media_id}: {str(e)}")
         return False
     except json.JSONDecodeError as e:
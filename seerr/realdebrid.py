@@ -8,22 +8,20 @@ import requests
 from datetime import datetime, timedelta
 from loguru import logger
 
-from seerr.config import RD_CLIENT_ID, RD_CLIENT_SECRET, RD_REFRESH_TOKEN, RD_ACCESS_TOKEN, update_env_file
+from seerr import browser as browser_module
+from seerr import config
+from seerr.config import load_config, update_env_file
 
 def refresh_access_token():
     """
     Refresh the Real-Debrid access token using the refresh token
-    Updates the global variables and environment file
+    Updates the config module and environment file
     """
-    global RD_REFRESH_TOKEN, RD_ACCESS_TOKEN
-    from seerr.config import RD_ACCESS_TOKEN, RD_REFRESH_TOKEN
-    from seerr.browser import driver
-
     TOKEN_URL = "https://api.real-debrid.com/oauth/v2/token"
     data = {
-        'client_id': RD_CLIENT_ID,
-        'client_secret': RD_CLIENT_SECRET,
-        'code': RD_REFRESH_TOKEN,
+        'client_id': config.RD_CLIENT_ID,
+        'client_secret': config.RD_CLIENT_SECRET,
+        'code': config.RD_REFRESH_TOKEN,
         'grant_type': 'http://oauth.net/grant_type/device/1.0'
     }
 
@@ -35,29 +33,22 @@ def refresh_access_token():
 
         if response.status_code == 200:
             expiry_time = int((datetime.now() + timedelta(hours=24)).timestamp() * 1000)
-            # Update the module-level variable
-            from seerr.config import RD_ACCESS_TOKEN as config_token
-            global RD_ACCESS_TOKEN
-            RD_ACCESS_TOKEN = json.dumps({
+            # Update the config module's variable so every reader sees the new token
+            config.RD_ACCESS_TOKEN = json.dumps({
                 "value": response_data['access_token'],
                 "expiry": expiry_time
             }, ensure_ascii=False)  # Ensure non-ASCII characters are preserved
             
-            # Update the config module's variable
-            import seerr.config
-            seerr.config.RD_ACCESS_TOKEN = RD_ACCESS_TOKEN
-            
             logger.info("Successfully refreshed access token.")
             
             update_env_file()
 
+            # Every search navigates to a fresh page, which picks up the new
+            # local storage, so there is no need to reload the current one.
+            driver = browser_module.driver
             if driver:
-                driver.execute_script(f"""
-                    localStorage.setItem('rd:accessToken', '{RD_ACCESS_TOKEN}');
-                """)
-                logger.info("Updated Real-Debrid credentials in local storage after token refresh.")
-                driver.refresh()
-                logger.info("Refreshed the page after updating local storage with the new token.")
+                if browser_module.install_real_debrid_tokens(driver, update_current_page=True):
+                    logger.info("Updated Real-Debrid credentials in local storage after token refresh.")
             return True
         else:
             logger.error(f"Failed to refresh access token: {response_data.get('error_description', 'Unknown error')}")
@@ -68,16 +59,12 @@ def refresh_access_token():
 
 def check_and_refresh_access_token():
     """Check if the access token is expired or about to expire and refresh it if necessary."""
-    from seerr.config import load_config
-    
     # Reload from environment to get the latest
     load_config(override=True)
     
-    # Get the token from the config module
-    import seerr.config
-    if seerr.config.RD_ACCESS_TOKEN:
+    if config.RD_ACCESS_TOKEN:
         try:
-            token_data = json.loads(seerr.config.RD_ACCESS_TOKEN)
+            token_data = json.loads(config.RD_ACCESS_TOKEN)
             expiry_time = token_data['expiry']  # This is in milliseconds
             current_time = int(time.time() * 1000)  # Convert current time to milliseconds
 
@@ -11,13 +11,15 @@ from loguru import logger
 from selenium.common.exceptions import WebDriverException
 
 from seerr import browser as browser_module
+from seerr import completed
 from seerr.browser import (
-    click_instant_rd_button,
     click_show_more_results,
     click_first_instant_rd_in_result_cards,
     ensure_with_extras_filter,
-    has_rd_100_result,
+    find_rd_100_or_click_instant_rd,
     set_search_query,
+    wait_for_rd_100_result,
+    wait_for_result_cards,
 )
 
 SEARCH_PATTERNS = [
@@ -55,9 +57,9 @@ class MediaWorkItem:
         return self.media_type == "tv"
 
 
-def run_media_job(work_items: List[MediaWorkItem]):
+def run_media_job(work_items: List[MediaWorkItem], active_driver=None):
     """Process requests, prioritising movies before shows."""
-    active_driver = browser_module.driver
+    active_driver = active_driver or browser_module.driver
     if not active_driver:
         logger.error("Browser driver is not ready; skipping job.")
         return
@@ -66,14 +68,19 @@ def run_media_job(work_items: List[MediaWorkItem]):
     shows = [item for item in work_items if item.is_show]
 
     for item in movies:
-        _process_movie(item, active_driver)
+        run_movie(item, active_driver)
 
     for item in shows:
         _process_show(item, active_driver)
 
 
-def _process_movie(item: MediaWorkItem, active_driver):
-    """Drive the movie workflow."""
+def run_movie(item: MediaWorkItem, active_driver):
+    """Drive the movie workflow. Movies are independent, so pooled sessions may run several at once."""
+    cache_key = completed.movie_key(item.imdb_id)
+    if completed.is_completed(cache_key):
+        logger.info(f"Movie '{item.title}' already completed on DMM; skipping.")
+        return
+
     url = f"https://debridmediamanager.com/movie/{item.imdb_id}"
     try:
         active_driver.get(url)
@@ -81,6 +88,7 @@ def _process_movie(item: MediaWorkItem, active_driver):
         _prepare_results_area(active_driver)
         hundred_found, clicked_instant = _movie_search_loop(active_driver)
         if hundred_found:
+            completed.record_completed(cache_key)
             logger.success(f"Movie '{item.title}' complete{' after Instant RD' if clicked_instant else ''}.")
         else:
             logger.warning(f"Movie '{item.title}' incomplete - no RD (100%) result found.")
@@ -94,32 +102,50 @@ def _process_show(item: MediaWorkItem, active_driver):
         logger.info(f"No pending seasons for '{item.title}'; skipping.")
         return
 
+    log_show_start(item)
+    done_seasons = sum(run_show_season(item, season, active_driver) for season in item.seasons)
+    log_show_result(item, done_seasons)
+
+
+def log_show_start(item: MediaWorkItem):
     season_list = ", ".join(str(s) for s in item.seasons)
     logger.info(f"Processing show '{item.title}' (request {item.request_id}) for seasons {season_list}")
 
-    completed = 0
-    for season in item.seasons:
-        try:
-            if _process_show_season(item, season, active_driver):
-                completed += 1
-        except WebDriverException as exc:
-            logger.error(f"Selenium error while processing {item.title} season {season}: {exc}")
 
-    if completed == len(item.seasons):
-        logger.success(f"Show '{item.title}' complete ({completed}/{len(item.seasons)} seasons).")
+def log_show_result(item: MediaWorkItem, done_seasons: int):
+    if done_seasons == len(item.seasons):
+        logger.success(f"Show '{item.title}' complete ({done_seasons}/{len(item.seasons)} seasons).")
     else:
-        logger.warning(f"Show '{item.title}' incomplete ({completed}/{len(item.seasons)} seasons).")
+        logger.warning(f"Show '{item.title}' incomplete ({done_seasons}/{len(item.seasons)} seasons).")
+
+
+def run_show_season(item: MediaWorkItem, season: int, active_driver) -> bool:
+    """
+    Process one season on `active_driver`. Seasons are independent, so pooled
+    sessions may run several of them at once from different worker threads.
+    """
+    try:
+        return _process_show_season(item, season, active_driver)
+    except WebDriverException as exc:
+        logger.error(f"Selenium error while processing {item.title} season {season}: {exc}")
+        return False
 
 
 def _process_show_season(item: MediaWorkItem, season: int, active_driver) -> bool:
     """Run the season-specific logic."""
+    cache_key = completed.season_key(item.imdb_id, season)
+    if completed.is_completed(cache_key):
+        logger.info(f"Season {season} for '{item.title}' already completed on DMM; skipping.")
+        return True
+
     url = f"https://debridmediamanager.com/show/{item.imdb_id}/{season}"
     active_driver.get(url)
-    logger.info(f"Opened {item.title} season {season} page ({url}).")
+    logger.debug(f"Opened {item.title} season {season} page ({url}).")
 
     _prepare_results_area(active_driver)
     complete, method = _show_search_loop(active_driver)
     if complete:
+        completed.record_completed(cache_key)
         suffix = f" via {method}" if method else ""
         logger.success(f"Season {season} for '{item.title}' complete{suffix}.")
         return True
@@ -129,10 +155,11 @@ def _process_show_season(item: MediaWorkItem, season: int, active_driver) -> boo
 
 
 def _prepare_results_area(active_driver):
-    """Allow the UI to load and expand the grid."""
-    time.sleep(10)
+    """Wait for the first results to settle, expand the grid, then let it settle again."""
+    if not wait_for_result_cards(active_driver, timeout=10):
+        logger.debug("No result cards appeared within 10s.")
     click_show_more_results(active_driver, attempts=3, wait_between=5)
-    time.sleep(5)
+    wait_for_result_cards(active_driver, timeout=5, stable_for=0.5)
 
 
 def _movie_search_loop(active_driver):
@@ -155,6 +182,9 @@ def _show_search_loop(active_driver):
 def _run_with_extras_instant_rd_tiers(active_driver) -> bool:
     """Retry the same search tiers, but use the 'With extras' filter + card Instant RD click."""
     total_tiers = len(SEARCH_PATTERNS)
+    # The first pattern waits for the chip to render; after that it is either on
+    # screen or absent, so later patterns only re-check it briefly.
+    chip_timeout = 5.0
     for tier_index, tier_patterns in enumerate(SEARCH_PATTERNS, start=1):
         logger.debug(f"Starting WITH-EXTRAS search tier {tier_index}/{total_tiers} ({len(tier_patterns)} patterns).")
         for pattern in tier_patterns:
@@ -165,9 +195,9 @@ def _run_with_extras_instant_rd_tiers(active_driver) -> bool:
                 logger.error(f"Failed to type search pattern '{pattern}': {exc}")
                 continue
 
-            # Enable the filter chip once results are present.
-            ensure_with_extras_filter(active_driver)
-            time.sleep(1)
+            # Enable the filter chip once results are present; a no-op while it stays enabled.
+            ensure_with_extras_filter(active_driver, timeout=chip_timeout)
+            chip_timeout = 1.0
 
             if click_first_instant_rd_in_result_cards(active_driver):
                 time.sleep(5)
@@ -202,21 +232,20 @@ def _run_search_tiers(active_driver, *, whole_season: bool):
                 logger.error(f"Failed to type search pattern '{pattern}': {exc}")
                 continue
 
-            if has_rd_100_result(active_driver):
+            found, clicked = find_rd_100_or_click_instant_rd(active_driver, whole_season=whole_season)
+            if found:
                 found_any = True
                 logger.debug(f"Tier {tier_index} produced an RD 100 result without Instant RD click.")
                 break  # move to next tier
 
-            if click_instant_rd_button(active_driver, whole_season=whole_season):
+            if clicked:
                 clicked_any = True
-                time.sleep(5)
-                if has_rd_100_result(active_driver):
+                if wait_for_rd_100_result(active_driver):
                     found_any = True
                     logger.debug(f"Tier {tier_index} produced an RD 100 result after Instant RD click.")
                     break
         else:
             # Finished this tier without success
             logger.debug(f"Search tier {tier_index} completed without RD 100 results.")
-            continue
 
     return found_any, clicked_any
@@ -2,13 +2,15 @@
 Trakt API integration module
 Handles fetching media information from Trakt
 """
+import asyncio
 import time
-import requests
+import httpx
 from typing import Optional, Dict, Tuple
 from datetime import datetime, timezone
 from loguru import logger
 
-from seerr.config import TRAKT_API_KEY
+from seerr import config
+from seerr.http_client import get_client
 
 # Trakt API rate limit: 1000 calls every 5 minutes
 TRAKT_RATE_LIMIT = 1000
@@ -17,16 +19,17 @@ TRAKT_RATE_LIMIT_PERIOD = 5 * 60  # 5 minutes in seconds
 trakt_api_calls = 0
 last_reset_time = time.time()
 
-def get_media_details_from_trakt(tmdb_id: str, media_type: str) -> Optional[dict]:
+def _headers() -> Dict[str, str]:
+    return {
+        "Content-type": "application/json",
+        "trakt-api-key": config.TRAKT_API_KEY or "",
+        "trakt-api-version": "2"
+    }
+
+async def _wait_for_rate_limit():
     """
-    Fetch media details from Trakt API using TMDb ID
-    
-    Args:
-        tmdb_id (str): TMDb ID of the movie or TV show
-        media_type (str): 'movie' or 'tv'
-        
-    Returns:
-        Optional[dict]: Media details if successful, None if failed
+    Reserve one Trakt call in the current rate-limit window.
+    Waits without blocking the event loop when the window is exhausted.
     """
     global trakt_api_calls, last_reset_time
 
@@ -36,23 +39,34 @@ def get_media_details_from_trakt(tmdb_id: str, media_type: str) -> Optional[dict
         last_reset_time = current_time
 
     if trakt_api_calls >= TRAKT_RATE_LIMIT:
-        logger.warning("Trakt API rate limit reached. Waiting for the next period.")
-        time.sleep(TRAKT_RATE_LIMIT_PERIOD - (current_time - last_reset_time))
+        wait_time = TRAKT_RATE_LIMIT_PERIOD - (current_time - last_reset_time)
+        logger.warning(f"Trakt API rate limit reached. Sleeping for {wait_time:.0f} seconds.")
+        await asyncio.sleep(wait_time)
         trakt_api_calls = 0
         last_reset_time = time.time()
 
+    # Count the call up front so concurrent lookups can't overshoot the limit
+    trakt_api_calls += 1
+
+async def get_media_details_from_trakt(tmdb_id: str, media_type: str) -> Optional[dict]:
+    """
+    Fetch media details from Trakt API using TMDb ID
+    
+    Args:
+        tmdb_id (str): TMDb ID of the movie or TV show
+        media_type (str): 'movie' or 'tv'
+        
+    Returns:
+        Optional[dict]: Media details if successful, None if failed
+    """
+    await _wait_for_rate_limit()
+
     # Determine the type based on media_type
     trakt_type = 'show' if media_type == 'tv' else 'movie'
     url = f"https://api.trakt.tv/search/tmdb/{tmdb_id}?type={trakt_type}"
-    headers = {
-        "Content-type": "application/json",
-        "trakt-api-key": TRAKT_API_KEY,
-        "trakt-api-version": "2"
-    }
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        trakt_api_calls += 1
+        response = await get_client().get(url, headers=_headers())
 
         if response.status_code == 200:
             data = response.json()
@@ -70,11 +84,11 @@ def get_media_details_from_trakt(tmdb_id: str, media_type: str) -> Optional[dict
         else:
             logger.error(f"Trakt API request failed with status code {response.status_code}")
             return None
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error fetching {trakt_type} details from Trakt API: {e}")
         return None
 
-def get_season_details_from_trakt(trakt_show_id: str, season_number: int) -> Optional[dict]:
+async def get_season_details_from_trakt(trakt_show_id: str, season_number: int) -> Optional[dict]:
     """
     Fetch season details from Trakt API using a Trakt show ID and season number.
     
@@ -85,8 +99,6 @@ def get_season_details_from_trakt(trakt_show_id: str, season_number: int) -> Opt
     Returns:
         Optional[dict]: Season details if successful, None if failed
     """
-    global trakt_api_calls, last_reset_time
-
     # Validate input parameters
     if not trakt_show_id or not isinstance(trakt_show_id, str):
         logger.error(f"Invalid trakt_show_id provided: {trakt_show_id}")
@@ -95,28 +107,13 @@ def get_season_details_from_trakt(trakt_show_id: str, season_number: int) -> Opt
         logger.error(f"Invalid season_number provided: {season_number}")
         return None
 
-    current_time = time.time()
-    if current_time - last_reset_time >= TRAKT_RATE_LIMIT_PERIOD:
-        trakt_api_calls = 0
-        last_reset_time = current_time
-
-    if trakt_api_calls >= TRAKT_RATE_LIMIT:
-        logger.warning("Trakt API rate limit reached. Waiting for the next period.")
-        time.sleep(TRAKT_RATE_LIMIT_PERIOD - (current_time - last_reset_time))
-        trakt_api_calls = 0
-        last_reset_time = time.time()
+    await _wait_for_rate_limit()
 
     url = f"https://api.trakt.tv/shows/{trakt_show_id}/seasons/{season_number}/info?extended=full"
-    headers = {
-        "Content-type": "application/json",
-        "trakt-api-key": TRAKT_API_KEY,
-        "trakt-api-version": "2"
-    }
 
     try:
         logger.info(f"Fetching season details for show ID {trakt_show_id}, season {season_number}")
-        response = requests.get(url, headers=headers, timeout=10)
-        trakt_api_calls += 1
+        response = await get_client().get(url, headers=_headers())
 
         if response.status_code == 200:
             data = response.json()
@@ -125,11 +122,11 @@ def get_season_details_from_trakt(trakt_show_id: str, season_number: int) -> Opt
         else:
             logger.error(f"Trakt API season request failed with status code {response.status_code}")
             return None
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error fetching season details from Trakt API for show ID {trakt_show_id}, season {season_number}: {e}")
         return None
 
-def check_next_episode_aired(trakt_show_id: str, season_number: int, current_aired_episodes: int) -> Tuple[bool, Optional[dict]]:
+async def check_next_episode_aired(trakt_show_id: str, season_number: int, current_aired_episodes: int) -> Tuple[bool, Optional[dict]]:
     """
     Check if the next episode (current_aired_episodes + 1) has aired for a given show and season.
     
@@ -143,8 +140,6 @@ def check_next_episode_aired(trakt_show_id: str, season_number: int, current_air
             - has_aired: True if the next episode has aired, False otherwise
             - episode_details: Episode details if the episode exists, None otherwise
     """
-    global trakt_api_calls, last_reset_time
-
     logger.debug(f"Starting check_next_episode_aired with trakt_show_id={trakt_show_id}, season_number={season_number}, current_aired_episodes={current_aired_episodes}")
 
     # Validate input parameters
@@ -158,36 +153,16 @@ def check_next_episode_aired(trakt_show_id: str, season_number: int, current_air
         logger.error(f"Invalid current_aired_episodes provided: {current_aired_episodes}")
         return False, None
 
-    current_time = time.time()
-    logger.debug(f"Current time: {current_time}, Last reset time: {last_reset_time}")
-
-    if current_time - last_reset_time >= TRAKT_RATE_LIMIT_PERIOD:
-        logger.debug("Rate limit period expired. Resetting API call counter.")
-        trakt_api_calls = 0
-        last_reset_time = current_time
-
-    if trakt_api_calls >= TRAKT_RATE_LIMIT:
-        wait_time = TRAKT_RATE_LIMIT_PERIOD - (current_time - last_reset_time)
-        logger.warning(f"Trakt API rate limit reached. Sleeping for {wait_time} seconds.")
-        time.sleep(wait_time)
-        trakt_api_calls = 0
-        last_reset_time = time.time()
-        logger.debug("Woke up from sleep. Reset API call counter.")
+    await _wait_for_rate_limit()
 
     next_episode_number = current_aired_episodes + 1
     url = f"https://api.trakt.tv/shows/{trakt_show_id}/seasons/{season_number}/episodes/{next_episode_number}?extended=full"
-    headers = {
-        "Content-type": "application/json",
-        "trakt-api-key": TRAKT_API_KEY,
-        "trakt-api-version": "2"
-    }
 
     logger.debug(f"Sending GET request to {url}")
 
     try:
         logger.info(f"Fetching next episode details for show ID {trakt_show_id}, season {season_number}, episode {next_episode_number}")
-        response = requests.get(url, headers=headers, timeout=10)
-        trakt_api_calls += 1
+        response = await get_client().get(url, headers=_headers())
         logger.debug(f"Received response with status code {response.status_code}")
 
         if response.status_code == 200:
@@ -223,6 +198,6 @@ def check_next_episode_aired(trakt_show_id: str, season_number: int, current_air
             logger.warning(f"Failed to fetch next episode details for show ID {trakt_show_id}, season {season_number}, episode {next_episode_number}: Status code {response.status_code}")
             return False, None
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error fetching next episode details from Trakt API for show ID {trakt_show_id}, season {season_number}, episode {next_episode_number}: {e}")
         return False, None 
\ No newline at end of file
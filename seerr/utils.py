@@ -1,30 +1,57 @@
 """
 Utility functions for SeerrBridge
 """
+import functools
 import re
+import time
 import inflect
 from loguru import logger
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz
 from deep_translator import GoogleTranslator
-from datetime import datetime
 
 
 # Initialize the inflect engine for number-word conversion
 p = inflect.engine()
 
-# Add a global variable to track start time
-START_TIME = datetime.now()
-
+# Process start on the monotonic clock; /status derives uptime from it
+START_MONOTONIC = time.monotonic()
+
+# Season patterns are used once per result title, so compile them up front
+_SEASON_EPISODE_RE = re.compile(r'S\d+E\d+', re.IGNORECASE)
+_SEASON_NUMBER_RE = re.compile(r"[sS](\d{1,2})")
+
+# Title cleanup runs for every search result, so these are compiled once as well
+_PUNCTUATION_RE = re.compile(r"[,:;'-]")
+_WHITESPACE_RE = re.compile(r'\s+')
+_NUMBER_RE = re.compile(r'\b\d+\b')
+_RESOLUTION_RE = re.compile(r'\b\d{3,4}p\b')
+_YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+
+_WORDS_TO_NUMBERS = {
+    "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4",
+    "five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9",
+    "ten": "10", "eleven": "11", "twelve": "12", "thirteen": "13",
+    "fourteen": "14", "fifteen": "15", "sixteen": "16", "seventeen": "17",
+    "eighteen": "18", "nineteen": "19", "twenty": "20"
+    # Add more mappings as needed
+}
+_NUMBER_WORD_RE = re.compile(r'\b(' + '|'.join(_WORDS_TO_NUMBERS) + r')\b', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _translate(title, target_lang):
+    # Exceptions aren't cached, so a failed lookup is retried on the next call.
+    translated_title = GoogleTranslator(source='auto', target=target_lang).translate(title)
+    logger.debug(f"Translated '{title}' to '{translated_title}'")
+    return translated_title
 
 def translate_title(title, target_lang='en'):
     """
     Detects the language of the input title and translates it to the target language.
+    Successful translations are cached, so repeated titles skip the network round trip.
     """
     try:
-        translator = GoogleTranslator(source='auto', target=target_lang)
-        translated_title = translator.translate(title)
-        logger.info(f"Translated '{title}' to '{translated_title}'")
-        return translated_title
+        return _translate(title, target_lang)
     except Exception as e:
         logger.error(f"Error translating title '{title}': {e}")
         return title  # Return the original title if translation fails
@@ -41,14 +68,14 @@ def clean_title(title, target_lang='en'):
     # For TV shows, extract just the main title (before any S01E01 pattern)
     # This helps with matching by ignoring episode info and technical specs
     main_title = translated_title
-    season_ep_match = re.search(r'S\d+E\d+', translated_title, re.IGNORECASE)
+    season_ep_match = _SEASON_EPISODE_RE.search(translated_title)
     if season_ep_match:
         main_title = translated_title[:season_ep_match.start()].strip()
     
     # Remove commas, hyphens, colons, semicolons, and apostrophes
-    cleaned_title = re.sub(r"[,:;'-]", '', main_title)
+    cleaned_title = _PUNCTUATION_RE.sub('', main_title)
     # Replace multiple spaces with a single dot
-    cleaned_title = re.sub(r'\s+', '.', cleaned_title)
+    cleaned_title = _WHITESPACE_RE.sub('.', cleaned_title)
     # Convert to lowercase for comparison
     return cleaned_title.lower()
 
@@ -66,34 +93,25 @@ def normalize_title(title, target_lang='en'):
     translated_title = translate_title(title, target_lang)
 
     # Replace multiple spaces with a single space and dots with spaces
-    normalized_title = re.sub(r'\s+', ' ', translated_title)
+    normalized_title = _WHITESPACE_RE.sub(' ', translated_title)
     normalized_title = normalized_title.replace('.', ' ')
     # Convert to lowercase
     return normalized_title.lower()
 
+@functools.lru_cache(maxsize=4096)
 def replace_numbers_with_words(title):
     """
     Replaces digits with their word equivalents (e.g., "3" to "three").
     """
-    return re.sub(r'\b\d+\b', lambda x: p.number_to_words(x.group()), title)
+    return _NUMBER_RE.sub(lambda x: p.number_to_words(x.group()), title)
 
+@functools.lru_cache(maxsize=4096)
 def replace_words_with_numbers(title):
     """
     Replaces number words with their digit equivalents (e.g., "three" to "3").
     """
-    words_to_numbers = {
-        "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4",
-        "five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9",
-        "ten": "10", "eleven": "11", "twelve": "12", "thirteen": "13",
-        "fourteen": "14", "fifteen": "15", "sixteen": "16", "seventeen": "17",
-        "eighteen": "18", "nineteen": "19", "twenty": "20"
-        # Add more mappings as needed
-    }
-
-    # Replace word numbers with digits
-    for word, digit in words_to_numbers.items():
-        title = re.sub(rf'\b{word}\b', digit, title, flags=re.IGNORECASE)
-    return title
+    # Replace word numbers with digits in a single pass
+    return _NUMBER_WORD_RE.sub(lambda x: _WORDS_TO_NUMBERS[x.group().lower()], title)
 
 def extract_year(text, expected_year=None, ignore_resolution=False):
     """
@@ -107,10 +125,10 @@ def extract_year(text, expected_year=None, ignore_resolution=False):
 
     # Remove common video resolutions that might interfere
     if ignore_resolution:
-        text = re.sub(r'\b\d{3,4}p\b', '', text)
+        text = _RESOLUTION_RE.sub('', text)
 
     # Extract years explicitly (avoid numbers inside movie titles)
-    years = re.findall(r'\b(19\d{2}|20\d{2})\b', text)
+    years = _YEAR_RE.findall(text)
     
     if years:
         # If multiple years are found, prefer the latest one
@@ -197,7 +215,7 @@ def extract_season(title):
     """
     Extract the season number from a title (e.g., 'naruto.s01.bdrip' → 1).
     """
-    season_match = re.search(r"[sS](\d{1,2})", title)
+    season_match = _SEASON_NUMBER_RE.search(title)
     if season_match:
         return int(season_match.group(1))
     return None 
\ No newline at end of file